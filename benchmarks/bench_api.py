@@ -0,0 +1,98 @@
+"""
+In-process load benchmark of the Flask app.
+
+Sends requests through `app.test_client()` (no network, no server) one after
+another and reports requests/second plus p50/p99 latency per endpoint and
+sequence size. This measures the per-request overhead of routing, JSON parsing,
+DTO validation, the `dna_tools` call and serialization. The result cache is
+disabled unless `--cache` is given, so repeated payloads are recomputed.
+
+Run from the project root:
+```bash
+python -m benchmarks.bench_api
+python -m benchmarks.bench_api --requests 5000 --sizes 100 10000 --output bench_api.json
+```
+"""
+import argparse
+import time
+
+from benchmarks.common import (
+  percentile,
+  random_codons,
+  random_sequence,
+  write_results
+)
+from dna.genetic_code import CODONS, get_code
+from flaskr import create_app
+
+_DEFAULT_SIZES = [100, 10_000, 1_000_000]
+_SENSE_CODONS = [codon for codon in CODONS if codon not in get_code().stops]
+
+def _payloads(size: int) -> list[tuple[str, dict]]:
+  dna = random_sequence("ATGC", size)
+  rna = "AUG" + random_codons(_SENSE_CODONS, max(size // 3 - 1, 0))
+  return [
+    ("/api/transcribe", {
+      "action" : "transcribe", "molecule_type" : "DNA",
+      "content" : { "sequence" : dna, "read_from" : "3", "to" : "5" }
+    }),
+    ("/api/translate", {
+      "action" : "translate", "molecule_type" : "RNA",
+      "content" : { "sequence" : rna, "read_from" : "5", "to" : "3", "naming_type" : "short" }
+    }),
+    ("/api/rna-to-dna", {
+      "action" : "rna-to-dna", "molecule_type" : "RNA",
+      "content" : { "sequence" : rna, "read_from" : "5", "to" : "3" }
+    }),
+  ]
+
+_CODON_PAYLOAD = {
+  "action" : "codon-to-protein", "molecule_type" : "RNA",
+  "content" : { "codon" : "GCU", "naming_type" : "3 letters" }
+}
+
+def _measure(client, path: str, payload: dict, requests: int) -> dict:
+  latencies = []
+  for _ in range(requests):
+    start = time.perf_counter()
+    response = client.post(path, json=payload)
+    latencies.append(time.perf_counter() - start)
+    if response.status_code != 200:
+      raise RuntimeError(f"{path} returned {response.status_code}: {response.get_data(as_text=True)[:200]}")
+  latencies.sort()
+  return {
+    "requests_per_second" : len(latencies) / sum(latencies),
+    "p50_ms" : percentile(latencies, 0.50) * 1000,
+    "p99_ms" : percentile(latencies, 0.99) * 1000
+  }
+
+def _requests_for(size: int, requests: int) -> int:
+  return max(requests * 100 // max(size, 100), 20) if size > 100 else requests
+
+def main(sizes: list[int], requests: int, cache: bool, output: str | None) -> list[dict]:
+  client = create_app(cache_entries=1_024 if cache else 0).test_client()
+  cases = [("/api/codon-to-protein", 3, _CODON_PAYLOAD)]
+  cases += [(path, size, payload) for size in sizes for path, payload in _payloads(size)]
+  
+  results = []
+  for path, size, payload in cases:
+    count = _requests_for(size, requests)
+    client.post(path, json=payload) # warm up
+    result = { "name" : path, "size" : size, "requests" : count, **_measure(client, path, payload, count) }
+    results.append(result)
+    print(
+      f"{path:<24} {size:>10,} b  {result['requests_per_second']:>10,.0f} req/s  "
+      f"p50 {result['p50_ms']:>9.3f} ms  p99 {result['p99_ms']:>9.3f} ms"
+    )
+  
+  write_results(output, "api", results)
+  return results
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+  parser.add_argument("--sizes", type=int, nargs="+", default=_DEFAULT_SIZES, help="sequence sizes in bases")
+  parser.add_argument("--requests", type=int, default=2_000, help="requests per small-payload case")
+  parser.add_argument("--cache", action="store_true", help="keep the result cache enabled")
+  parser.add_argument("--output", help="write JSON results to this file ('-' for stdout)")
+  args = parser.parse_args()
+  main(args.sizes, args.requests, args.cache, args.output)
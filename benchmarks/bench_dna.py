@@ -0,0 +1,92 @@
+"""
+Benchmark suite for the `dna` package.
+
+Covers `transcribe`, `rna_to_dna`, `translate` and `codon_to_protein` /
+`codons_to_proteins` over a range of sequence sizes, including the translation
+edge cases that take different paths: a frame with no stop codon (scans to the
+end), an early stop codon (stops after a few codons) and a 3'->5' read (reverses
+first). Inputs are seeded, so every run measures the same sequences.
+
+Run from the project root:
+```bash
+python -m benchmarks.bench_dna                          # 100 b .. 10 Mb
+python -m benchmarks.bench_dna --full                   # up to 100 Mb
+python -m benchmarks.bench_dna --sizes 1000 1000000 --output bench_dna.json
+```
+"""
+import argparse
+
+from benchmarks.common import (
+  best_of,
+  random_codons,
+  random_sequence,
+  repeat_for,
+  write_results
+)
+from dna.dna_tools import (
+  transcribe,
+  translate,
+  rna_to_dna,
+  codon_to_protein,
+  codons_to_proteins
+)
+from dna.genetic_code import CODONS, get_code
+
+_DEFAULT_SIZES = [100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+_FULL_SIZES = _DEFAULT_SIZES + [100_000_000]
+_SENSE_CODONS = [codon for codon in CODONS if codon not in get_code().stops]
+_CODON_CALLS = 100_000
+
+def _rna_without_stop(size: int) -> str:
+  return "AUG" + random_codons(_SENSE_CODONS, max(size // 3 - 1, 0))
+
+def _rna_with_early_stop(size: int) -> str:
+  head = "AUG" + random_codons(_SENSE_CODONS, 10, seed=1) + "UAA"
+  return head + random_sequence("AUGC", max(size - len(head), 0))
+
+def _cases(size: int) -> list[tuple[str, object]]:
+  dna = random_sequence("ATGC", size)
+  rna = random_sequence("AUGC", size)
+  no_stop = _rna_without_stop(size)
+  early_stop = _rna_with_early_stop(size)
+  reversed_no_stop = no_stop[::-1]
+  codons = [CODONS[i % 64] for i in range(min(size // 3, 10_000))]
+  return [
+    ("transcribe 3->5", lambda: transcribe(dna, "3", "5")),
+    ("transcribe 5->3", lambda: transcribe(dna, "5", "3")),
+    ("rna_to_dna", lambda: rna_to_dna(rna)),
+    ("translate no stop", lambda: translate(no_stop, naming_type="short")),
+    ("translate early stop", lambda: translate(early_stop, naming_type="short")),
+    ("translate 3->5", lambda: translate(reversed_no_stop, "3", "5", naming_type="short")),
+    ("codons_to_proteins", lambda: codons_to_proteins(codons, "3 letters")),
+  ]
+
+def _codon_to_protein_case() -> dict:
+  def run():
+    for _ in range(_CODON_CALLS):
+      codon_to_protein("GCU", "3 letters")
+  seconds = best_of(run, 5) / _CODON_CALLS
+  return { "name" : "codon_to_protein", "size" : 3, "seconds" : seconds, "calls_per_second" : 1 / seconds }
+
+def main(sizes: list[int], output: str | None) -> list[dict]:
+  results = []
+  for size in sizes:
+    for name, func in _cases(size):
+      seconds = best_of(func, repeat_for(size))
+      results.append({ "name" : name, "size" : size, "seconds" : seconds, "bases_per_second" : size / seconds })
+      print(f"{name:<22} {size:>12,} b  {seconds * 1000:>12.3f} ms  {size / seconds:>16,.0f} b/s")
+  
+  result = _codon_to_protein_case()
+  results.append(result)
+  print(f"{result['name']:<22} {'':>14}  {result['seconds'] * 1e6:>12.3f} us  {result['calls_per_second']:>16,.0f} calls/s")
+  
+  write_results(output, "dna", results)
+  return results
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+  parser.add_argument("--sizes", type=int, nargs="+", help="sequence sizes in bases")
+  parser.add_argument("--full", action="store_true", help="include the 100 Mb inputs")
+  parser.add_argument("--output", help="write JSON results to this file ('-' for stdout)")
+  args = parser.parse_args()
+  main(args.sizes or (_FULL_SIZES if args.full else _DEFAULT_SIZES), args.output)
@@ -0,0 +1,80 @@
+"""
+Throughput of the Flask app with the stdlib JSON provider against the orjson-backed
+`flaskr.json_provider.FastJSONProvider`, per endpoint and sequence size.
+
+Uses the same in-process client and payloads as `bench_api`. Request bodies are
+encoded once up front, so only the server side (parsing, validation, work and
+response serialization) is timed. Without orjson installed both providers run
+the stdlib `json` module and should measure the same.
+
+Run from the project root:
+```bash
+python -m benchmarks.bench_json
+python -m benchmarks.bench_json --sizes 100 10000 1000000 --output bench_json.json
+```
+"""
+import argparse
+import json
+import time
+
+from flask.json.provider import DefaultJSONProvider
+
+from benchmarks.bench_api import _CODON_PAYLOAD, _payloads, _requests_for
+from benchmarks.common import percentile, write_results
+from flaskr import create_app, json_provider
+
+_DEFAULT_SIZES = [100, 10_000, 100_000, 1_000_000]
+_PROVIDERS = {
+  "stdlib" : DefaultJSONProvider,
+  "fast" : json_provider.FastJSONProvider
+}
+
+def _measure(client, path: str, body: bytes, requests: int) -> dict:
+  latencies = []
+  for _ in range(requests):
+    start = time.perf_counter()
+    response = client.post(path, data=body, content_type="application/json")
+    latencies.append(time.perf_counter() - start)
+    if response.status_code != 200:
+      raise RuntimeError(f"{path} returned {response.status_code}: {response.get_data(as_text=True)[:200]}")
+  latencies.sort()
+  return {
+    "requests_per_second" : len(latencies) / sum(latencies),
+    "p50_ms" : percentile(latencies, 0.50) * 1000,
+    "p99_ms" : percentile(latencies, 0.99) * 1000
+  }
+
+def main(sizes: list[int], requests: int, output: str | None) -> list[dict]:
+  app = create_app(cache_entries=0)
+  client = app.test_client()
+  cases = [("/api/codon-to-protein", 3, _CODON_PAYLOAD)]
+  cases += [(path, size, payload) for size in sizes for path, payload in _payloads(size)]
+  print(f"orjson installed: {json_provider.HAS_ORJSON}")
+  
+  results = []
+  for path, size, payload in cases:
+    body = json.dumps(payload).encode()
+    count = _requests_for(size, requests)
+    measured = {}
+    for name, provider in _PROVIDERS.items():
+      app.json = provider(app)
+      client.post(path, data=body, content_type="application/json") # warm up
+      measured[name] = _measure(client, path, body, count)
+      results.append({ "name" : f"{path} {name}", "size" : size, "requests" : count, **measured[name] })
+    
+    speedup = measured["fast"]["requests_per_second"] / measured["stdlib"]["requests_per_second"]
+    print(
+      f"{path:<24} {size:>10,} b  stdlib {measured['stdlib']['requests_per_second']:>9,.0f} req/s  "
+      f"fast {measured['fast']['requests_per_second']:>9,.0f} req/s  x{speedup:.2f}"
+    )
+  
+  write_results(output, "json", results)
+  return results
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+  parser.add_argument("--sizes", type=int, nargs="+", default=_DEFAULT_SIZES, help="sequence sizes in bases")
+  parser.add_argument("--requests", type=int, default=2_000, help="requests per small-payload case")
+  parser.add_argument("--output", help="write JSON results to this file ('-' for stdout)")
+  args = parser.parse_args()
+  main(args.sizes, args.requests, args.output)
@@ -0,0 +1,60 @@
+"""
+Scaling of chunked transcription (`dna.parallel`) across 1..N worker processes,
+against the single-process `transcribe`.
+
+Run from the project root:
+```bash
+python -m benchmarks.bench_parallel
+python -m benchmarks.bench_parallel --sizes 10000000 100000000 --workers 1 2 4 8 --output bench_parallel.json
+```
+"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.common import (
+  best_of,
+  random_sequence,
+  repeat_for,
+  write_results
+)
+from dna import parallel
+from dna.dna_tools import transcribe
+
+_DEFAULT_SIZES = [10_000_000, 50_000_000]
+
+def _default_workers() -> list[int]:
+  cores = os.cpu_count() or 1
+  return sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1)))
+
+def main(sizes: list[int], workers: list[int], output: str | None) -> list[dict]:
+  results = []
+  parallel.prepare_pool()
+  for size in sizes:
+    dna = random_sequence("ATGC", size)
+    repeat = max(repeat_for(size), 3)
+    serial = best_of(lambda: transcribe(dna, include_full_sequence=False), repeat)
+    results.append({ "name" : "transcribe serial", "size" : size, "workers" : 0, "seconds" : serial })
+    print(f"{size:>12,} b  serial      {serial * 1e3:>9.1f} ms")
+    
+    for count in workers:
+      with ProcessPoolExecutor(max_workers=count) as pool:
+        # start every worker before timing
+        list(pool.map(abs, range(count)))
+        seconds = best_of(lambda: transcribe(dna, include_full_sequence=False, executor=pool), repeat)
+      results.append({
+        "name" : "transcribe parallel", "size" : size, "workers" : count,
+        "seconds" : seconds, "speedup" : serial / seconds
+      })
+      print(f"{size:>12,} b  {count:>2} workers  {seconds * 1e3:>9.1f} ms  x{serial / seconds:.2f}")
+  
+  write_results(output, "parallel", results)
+  return results
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+  parser.add_argument("--sizes", type=int, nargs="+", default=_DEFAULT_SIZES, help="sequence sizes in bases")
+  parser.add_argument("--workers", type=int, nargs="+", default=_default_workers(), help="worker counts to try")
+  parser.add_argument("--output", help="write JSON results to this file ('-' for stdout)")
+  args = parser.parse_args()
+  main(args.sizes, args.workers, args.output)
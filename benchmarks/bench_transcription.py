@@ -0,0 +1,76 @@
+"""
+Microbenchmark for the table-driven transcription engine.
+
+Compares the previous per-base generator implementation against
+`dna.dna_tools.transcribe` / `rna_to_dna` and reports bases/second.
+
+Run from the project root:
+```bash
+python -m benchmarks.bench_transcription            # 1 kb, 1 Mb, 50 Mb
+python -m benchmarks.bench_transcription 1000 1000000 --output bench_transcription.json
+```
+"""
+import argparse
+
+from benchmarks.common import best_of, random_sequence, write_results
+from dna.dna_tools import (
+  transcribe,
+  rna_to_dna,
+  _BASE_PAIRS,
+  _BASE_PAIRS_REV_MAP,
+  _VALID_DNA_BASES,
+  _VALID_RNA_BASES
+)
+
+_DEFAULT_SIZES = [1_000, 1_000_000, 50_000_000]
+
+# ! previous implementation, kept here only as the "before" reference
+def _legacy_transcribe(dna: str) -> str:
+  dna = dna.upper()
+  if not all(base in _VALID_DNA_BASES for base in dna):
+    raise ValueError("invalid base")
+  return "".join(_BASE_PAIRS.get(base.upper(), "?") for base in dna)
+
+def _legacy_rna_to_dna(rna: str) -> str:
+  rna = rna.upper()
+  if not all(base in _VALID_RNA_BASES for base in rna):
+    raise ValueError("invalid base")
+  return "".join(_BASE_PAIRS_REV_MAP[base] for base in rna)
+
+# ! helpers
+def _report(label: str, size: int, before: float, after: float) -> None:
+  print(
+    f"{label:<12} {size:>12,} b  "
+    f"before {size / before:>14,.0f} b/s  "
+    f"after {size / after:>16,.0f} b/s  "
+    f"x{before / after:,.1f}"
+  )
+
+def _result(name: str, size: int, seconds: float) -> dict:
+  return { "name" : name, "size" : size, "seconds" : seconds, "bases_per_second" : size / seconds }
+
+def main(sizes: list[int], output: str | None) -> list[dict]:
+  results = []
+  for size in sizes:
+    repeat = 5 if size <= 1_000_000 else 1
+    dna = random_sequence("ATGC", size)
+    rna = random_sequence("AUGC", size)
+    cases = [
+      ("transcribe", lambda: _legacy_transcribe(dna), lambda: transcribe(dna)),
+      ("rna_to_dna", lambda: _legacy_rna_to_dna(rna), lambda: rna_to_dna(rna))
+    ]
+    for name, legacy, current in cases:
+      before = best_of(legacy, repeat)
+      after = best_of(current, repeat)
+      _report(name, size, before, after)
+      results += [_result(f"{name} legacy", size, before), _result(name, size, after)]
+  
+  write_results(output, "transcription", results)
+  return results
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+  parser.add_argument("sizes", type=int, nargs="*", default=_DEFAULT_SIZES, help="sequence sizes in bases")
+  parser.add_argument("--output", help="write JSON results to this file ('-' for stdout)")
+  args = parser.parse_args()
+  main(args.sizes, args.output)
@@ -0,0 +1,65 @@
+"""
+Per-request validation cost: `json.loads` + `model_validate` (parse into a dict,
+then build the DTO) against `model_validate_json` (parse and validate the raw
+body in one pass), as used by `flaskr.middleware.validate_req`.
+
+Run from the project root:
+```bash
+python -m benchmarks.bench_validation
+python -m benchmarks.bench_validation --sizes 100 1000000 --output bench_validation.json
+```
+"""
+import argparse
+import json
+
+from benchmarks.common import (
+  best_of,
+  random_sequence,
+  write_results
+)
+from dto.request_dto import TranscribeReqDto, TranslateReqDto
+
+_DEFAULT_SIZES = [100, 10_000, 1_000_000]
+
+def _bodies(size: int) -> list[tuple[str, type, bytes]]:
+  dna = random_sequence("ATGC", size)
+  rna = random_sequence("AUGC", size)
+  return [
+    ("transcribe", TranscribeReqDto, json.dumps({
+      "action" : "transcribe", "molecule_type" : "DNA",
+      "content" : { "sequence" : dna, "read_from" : "3", "to" : "5" }
+    }).encode()),
+    ("translate", TranslateReqDto, json.dumps({
+      "action" : "translate", "molecule_type" : "RNA",
+      "content" : { "sequence" : rna, "read_from" : "5", "to" : "3", "naming_type" : "short" }
+    }).encode()),
+  ]
+
+def main(sizes: list[int], output: str | None) -> list[dict]:
+  results = []
+  for size in sizes:
+    calls = max(10_000 * 100 // max(size, 100), 10)
+    for name, dto, body in _bodies(size):
+      timings = {
+        "dict" : best_of(lambda: [dto.model_validate(json.loads(body)) for _ in range(calls)], 3) / calls,
+        "json" : best_of(lambda: [dto.model_validate_json(body) for _ in range(calls)], 3) / calls
+      }
+      for path, seconds in timings.items():
+        results.append({
+          "name" : f"{name} {path}", "size" : size,
+          "seconds" : seconds, "calls_per_second" : 1 / seconds
+        })
+      print(
+        f"{name:<12} {size:>12,} b  loads+model_validate {timings['dict'] * 1e6:>10.2f} us  "
+        f"model_validate_json {timings['json'] * 1e6:>10.2f} us  x{timings['dict'] / timings['json']:.2f}"
+      )
+  
+  write_results(output, "validation", results)
+  return results
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+  parser.add_argument("--sizes", type=int, nargs="+", default=_DEFAULT_SIZES, help="sequence sizes in bases")
+  parser.add_argument("--output", help="write JSON results to this file ('-' for stdout)")
+  args = parser.parse_args()
+  main(args.sizes, args.output)
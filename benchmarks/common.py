@@ -0,0 +1,80 @@
+"""
+Shared helpers for the benchmark scripts: deterministic inputs, timing and
+machine-readable output.
+
+Every script can write its results as JSON (`--output results.json`) with the
+same layout, so runs from different commits can be compared with
+`python -m benchmarks.compare before.json after.json`:
+```
+{
+  "meta" : { "benchmark", "commit", "python", "platform", "numpy", "timestamp" },
+  "results" : [ { "name" : str, "size" : int, ...metrics } ]
+}
+```
+"""
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+from dna import numpy_backend
+
+def random_sequence(alphabet: str, size: int, seed: int = 0) -> str:
+  rng = random.Random(f"{seed}:{size}")
+  return "".join(rng.choices(alphabet, k=size))
+
+def random_codons(codons: list[str], count: int, seed: int = 0) -> str:
+  rng = random.Random(f"{seed}:{count}")
+  return "".join(rng.choices(codons, k=count))
+
+def best_of(func, repeat: int) -> float:
+  """Best wall time in seconds of `repeat` calls of `func()`."""
+  best = float("inf")
+  for _ in range(repeat):
+    start = time.perf_counter()
+    func()
+    best = min(best, time.perf_counter() - start)
+  return best
+
+def repeat_for(size: int) -> int:
+  """Fewer repetitions for large inputs so a full run stays in minutes."""
+  if size <= 100_000:
+    return 7
+  return 3 if size <= 10_000_000 else 1
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+  index = min(len(sorted_values) - 1, max(0, round(fraction * (len(sorted_values) - 1))))
+  return sorted_values[index]
+
+def _commit() -> str | None:
+  try:
+    return subprocess.run(
+      ["git", "rev-parse", "--short", "HEAD"],
+      capture_output=True, text=True, check=True
+    ).stdout.strip()
+  except (OSError, subprocess.CalledProcessError):
+    return None
+
+def metadata(benchmark: str) -> dict:
+  return {
+    "benchmark" : benchmark,
+    "commit" : _commit(),
+    "python" : sys.version.split()[0],
+    "platform" : platform.platform(),
+    "numpy" : numpy_backend.HAS_NUMPY,
+    "timestamp" : datetime.now(timezone.utc).isoformat(timespec="seconds")
+  }
+
+def write_results(path: str | None, benchmark: str, results: list[dict]) -> None:
+  """Write `results` with run metadata to `path` (`-` for stdout), if given."""
+  if path is None:
+    return
+  document = json.dumps({ "meta" : metadata(benchmark), "results" : results }, indent=2)
+  if path == "-":
+    print(document)
+    return
+  with open(path, "w", encoding="utf-8") as file:
+    file.write(document + "\n")
@@ -0,0 +1,46 @@
+"""
+Compare two JSON result files written by the benchmark scripts.
+
+Results are matched on `(name, size)` and the first throughput metric found
+(`bases_per_second`, `calls_per_second` or `requests_per_second`) is compared.
+Exits with status 1 when any case got slower than `--threshold` (default 10%).
+
+```bash
+python -m benchmarks.compare before.json after.json
+```
+"""
+import argparse
+import json
+import sys
+
+_THROUGHPUT_KEYS = ("bases_per_second", "calls_per_second", "requests_per_second")
+
+def _load(path: str) -> dict[tuple[str, int], dict]:
+  with open(path, encoding="utf-8") as file:
+    document = json.load(file)
+  return { (result["name"], result["size"]): result for result in document["results"] }
+
+def _throughput(result: dict) -> float | None:
+  return next((result[key] for key in _THROUGHPUT_KEYS if key in result), None)
+
+def main(before_path: str, after_path: str, threshold: float) -> int:
+  before, after = _load(before_path), _load(after_path)
+  regressions = 0
+  for key in sorted(before.keys() & after.keys()):
+    old, new = _throughput(before[key]), _throughput(after[key])
+    if not old or new is None:
+      continue
+    change = new / old - 1
+    flag = ""
+    if change < -threshold:
+      flag, regressions = "  REGRESSION", regressions + 1
+    print(f"{key[0]:<24} {key[1]:>12,}  {old:>16,.0f} -> {new:>16,.0f}  {change:>+8.1%}{flag}")
+  return 1 if regressions else 0
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+  parser.add_argument("before")
+  parser.add_argument("after")
+  parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown (0.10 = 10%%)")
+  args = parser.parse_args()
+  sys.exit(main(args.before, args.after, args.threshold))
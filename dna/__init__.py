@@ -1,11 +1,25 @@
 __all__ = [
+  "cache",
   "dna_tools",
   "error_enum",
   "error_types",
-  "result_types"
+  "fasta",
+  "genetic_code",
+  "numpy_backend",
+  "packed",
+  "parallel",
+  "result_types",
+  "validation"
 ]
 
+from . import cache
 from . import dna_tools
 from . import error_enum
 from . import error_types
+from . import fasta
+from . import genetic_code
+from . import numpy_backend
+from . import packed
+from . import parallel
 from . import result_types
+from . import validation
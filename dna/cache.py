@@ -0,0 +1,136 @@
+"""
+Bounded LRU cache for `dna_tools` results.
+
+Entries are keyed by a BLAKE2b digest of the operation, its parameters and the
+sequence, so the cache never keeps the (possibly huge) input sequence alive. The
+cache is bounded both by entry count and by an estimate of the bytes held by the
+cached results; least recently used entries are evicted first.
+
+Cached results are shared between callers and must be treated as read-only.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, TypedDict
+
+class CacheStats(TypedDict):
+  """
+  ### Value:
+  ```
+  {
+    "hits" : int,
+    "misses" : int,
+    "evictions" : int,
+    "entries" : int,
+    "bytes" : int,
+    "max_entries" : int,
+    "max_bytes" : int
+  }
+  ```
+  """
+  hits: int
+  misses: int
+  evictions: int
+  entries: int
+  bytes: int
+  max_entries: int
+  max_bytes: int
+
+SIZE_SAMPLE = 16 # list items measured by `estimate_size`, the rest are assumed alike
+
+def estimate_size(value: object) -> int:
+  """
+  Rough size in bytes of a result made of dicts, lists, strings and scalars. Long
+  lists (protein names, ORFs) are estimated from `SIZE_SAMPLE` evenly spaced items,
+  so the cost does not grow with the sequence length.
+  """
+  if isinstance(value, str):
+    return len(value) + 49
+  if isinstance(value, dict):
+    return 64 + sum(estimate_size(key) + estimate_size(item) for key, item in value.items())
+  if isinstance(value, (list, tuple)):
+    count = len(value)
+    sample = value if count <= SIZE_SAMPLE else value[::count // SIZE_SAMPLE][:SIZE_SAMPLE]
+    items = sum(estimate_size(item) for item in sample)
+    return 56 + 8 * count + (items * count // len(sample) if sample else 0)
+  return 28
+
+def make_key(operation: str, sequence: str, **params) -> bytes:
+  """Digest of `(operation, sorted params, sequence)`."""
+  digest = hashlib.blake2b(digest_size=16)
+  digest.update(repr((operation, sorted(params.items()))).encode())
+  digest.update(sequence.encode("utf-8", "surrogatepass"))
+  return digest.digest()
+
+class ResultCache:
+  """Thread-safe LRU cache bounded by entry count and estimated result bytes."""
+  def __init__(self, max_entries: int = 1_024, max_bytes: int = 64 * 1024 * 1024):
+    self._lock = threading.Lock()
+    self._entries: OrderedDict[bytes, tuple[object, int]] = OrderedDict()
+    self._bytes = 0
+    self.max_entries = max_entries
+    self.max_bytes = max_bytes
+    self.hits = self.misses = self.evictions = 0
+  
+  def configure(self, max_entries: int, max_bytes: int) -> None:
+    """Change the limits (`max_entries=0` disables caching) and evict down to them."""
+    with self._lock:
+      self.max_entries, self.max_bytes = max_entries, max_bytes
+      self._evict()
+  
+  def clear(self) -> None:
+    """Drop every entry and reset the counters."""
+    with self._lock:
+      self._entries.clear()
+      self._bytes = 0
+      self.hits = self.misses = self.evictions = 0
+  
+  def _evict(self) -> None:
+    while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+      _, (_, size) = self._entries.popitem(last=False)
+      self._bytes -= size
+      self.evictions += 1
+  
+  def get(self, key: bytes) -> object | None:
+    """Return the cached value for `key` (marking it recently used), or None."""
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is None:
+        self.misses += 1
+        return None
+      self._entries.move_to_end(key)
+      self.hits += 1
+      return entry[0]
+  
+  def put(self, key: bytes, value: object) -> None:
+    """Store `value`, unless caching is disabled or it alone exceeds the byte budget."""
+    size = estimate_size(value)
+    with self._lock:
+      if self.max_entries <= 0 or size > self.max_bytes:
+        return
+      old = self._entries.pop(key, None)
+      if old is not None:
+        self._bytes -= old[1]
+      self._entries[key] = (value, size)
+      self._bytes += size
+      self._evict()
+  
+  def get_or_compute(self, key: bytes, compute: Callable[[], object]) -> object:
+    """Return the cached value for `key`, or call `compute` and cache its result."""
+    value = self.get(key)
+    if value is None:
+      value = compute()
+      self.put(key, value)
+    return value
+  
+  def stats(self) -> CacheStats:
+    with self._lock:
+      return {
+        "hits" : self.hits,
+        "misses" : self.misses,
+        "evictions" : self.evictions,
+        "entries" : len(self._entries),
+        "bytes" : self._bytes,
+        "max_entries" : self.max_entries,
+        "max_bytes" : self.max_bytes
+      }
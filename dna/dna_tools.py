@@ -1,20 +1,39 @@
+import base64
+import errno
+import mmap
+import os
+from concurrent.futures import Executor
+from contextlib import contextmanager, suppress
+from typing import IO, Iterator
 from dna.result_types import (
   TranscribeResult,
   TranslateResult,
+  TranslateColumnarResult,
+  TranscribeFileResult,
+  TranslateFileResult,
   RnaToDnaResult,
-  CodonToProteinResult
+  CodonToProteinResult,
+  CodonsToProteinsResult,
+  OrfResult,
+  FindOrfsResult
 )
 from dna.error_enum import (
   ErrorMessage,
   invalid_edge_message
 )
 from dna.error_types import (
+  MoleculeStructureError,
   InvalidDnaError,
   InvalidRnaError,
   NoStartCodonError,
   InvalidStrandReadError,
   InvalidCodonError
 )
+from dna import numpy_backend
+from dna import parallel
+from dna.genetic_code import STANDARD, GeneticCode, get_code
+from dna.packed import PackedSequence
+from dna.validation import BaseValidator
 
 # constant terms declaration
 _BASE_PAIRS = {
@@ -55,16 +74,293 @@ _VALID_EDGES = {("3", "5"), ("5", "3")}
 _VALID_DNA_BASES = {"A", "T", "G", "C"}
 _VALID_RNA_BASES = {"A", "G", "C", "U"}
 
+# 64-entry codon lookups, indexed by 16*a + 4*b + c (see dna.numpy_backend)
+_CODONS = tuple(a + b + c for a in numpy_backend.CODON_BASES
+                for b in numpy_backend.CODON_BASES
+                for c in numpy_backend.CODON_BASES)
+_CODON_INDEX = { codon: index for index, codon in enumerate(_CODONS) }
+
+# codon_to_protein responses for every codon, rendered once per naming type
+_NAME_INDEX = {"short" : 0, "3 letters" : 1, "long" : 2}
+_NAME_DELIM = {"short" : "", "3 letters" : "-", "long" : "---"}
+_CODON_RESPONSES: dict[str, dict[str, CodonToProteinResult]] = {
+  naming_type: {
+    codon: {
+      "naming_type" : naming_type,
+      "protein" : _PROTEIN_CODON_REV_MAP[codon][name_index],
+      "synonymous_codons" : tuple(sorted(_PROTEIN_CODON[_PROTEIN_CODON_REV_MAP[codon]]))
+    }
+    for codon in _CODONS
+  }
+  for naming_type, name_index in _NAME_INDEX.items()
+}
+_DEFAULT_CODON_RESPONSES = _CODON_RESPONSES["3 letters"]
+
+def _naming(naming_type: str) -> tuple[int, str, str]:
+  """Indeks nama protein, pemisah antar protein, dan <code>naming_type</code> yang dipakai ("3 letters" jika tidak dikenal)."""
+  if naming_type not in _NAME_INDEX:
+    naming_type = "3 letters"
+  return _NAME_INDEX[naming_type], _NAME_DELIM[naming_type], naming_type
+
+# translation tables, compiled once so complement runs in C
+def _complement_table(pairs: dict[str, str]) -> dict[int, str]:
+  """Build a `str.translate` table that complements and upper-cases in one pass."""
+  table = str.maketrans(pairs)
+  table.update(str.maketrans({ key.lower(): val for key, val in pairs.items() }))
+  return table
+
+_TRANSCRIBE_TABLE = _complement_table(_BASE_PAIRS)
+_RNA_TO_DNA_TABLE = _complement_table(_BASE_PAIRS_REV_MAP)
+_RNA_COMPLEMENT_TABLE = _complement_table({ "A" : "U", "U" : "A", "G" : "C", "C" : "G" })
+_DNA_VALIDATOR = BaseValidator("".join(_VALID_DNA_BASES))
+_RNA_VALIDATOR = BaseValidator("".join(_VALID_RNA_BASES))
+
+# byte-level equivalents for dna.parallel, which works on shared memory
+def _complement_bytes(pairs: dict[str, str]) -> tuple[bytes, bytes]:
+  """<code>bytes.maketrans</code> table that complements and upper-cases, plus every valid byte."""
+  keys = "".join(pairs) + "".join(pairs).lower()
+  values = "".join(pairs.values()) * 2
+  return bytes.maketrans(keys.encode(), values.encode()), keys.encode()
+
+_TRANSCRIBE_BYTES, _VALID_DNA_BYTES = _complement_bytes(_BASE_PAIRS)
+_RNA_TO_DNA_BYTES, _VALID_RNA_BYTES = _complement_bytes(_BASE_PAIRS_REV_MAP)
+
+# file input is read through mmap in windows of this many bytes
+FILE_WINDOW = 4 * 1024 * 1024
+_WHITESPACE = b" \t\r\n"
+
 # functions declaration
+# ! packed input
+def _check_packed_kind(seq: PackedSequence, kind: str) -> None:
+  """Tolak PackedSequence yang jenisnya (DNA/RNA) tidak sesuai, dengan error yang sama seperti input string."""
+  if seq.kind == kind:
+    return
+  if kind == "DNA":
+    raise InvalidDnaError(
+      message=f"{ErrorMessage.DNA_HAS_INVALID_BASE.value}: U",
+      status_code=400
+    )
+  raise InvalidRnaError(
+    message=f"{ErrorMessage.RNA_HAS_INVALID_BASE.value}: T",
+    status_code=400
+  )
+
+# ! reading frame
+def _reading_frame(rna: str, start: int, stops: frozenset[str] | set[str] = _STOP_CODONS) -> Iterator[str]:
+  """
+  Menghasilkan kodon satu per satu mulai dari indeks <code>start</code>, berhenti setelah stop codon pertama
+  (menurut <code>stops</code>) atau saat sisa basa tidak cukup untuk satu kodon.
+  """
+  for i in range(start, len(rna) - 2, 3):
+    codon = rna[i:i+3]
+    yield codon
+    if codon in stops:
+      return
+
+def _find_start(rna: str, code: GeneticCode, alternative_starts: bool) -> int:
+  """Indeks start codon pertama (AUG, atau start codon mana pun dari <code>code</code>), -1 jika tidak ada."""
+  if not alternative_starts:
+    return rna.find(_START_CODON)
+  match = code.start_pattern.search(rna)
+  return match.start() if match else -1
+
+def _translate_frame(rna: str, start: int, code: GeneticCode, name_index: int) -> list[str]:
+  """Nama asam amino tiap kodon mulai dari <code>start</code> hingga stop codon pertama (inklusif)."""
+  names = code.names[name_index]
+  if numpy_backend.HAS_NUMPY and len(rna) - start >= numpy_backend.MIN_LENGTH:
+    return numpy_backend.translate_frame(rna, start, names, code.is_stop)
+  # convert codon into its amino acid, then list them
+  return [code.codon_names[codon][name_index] for codon in _reading_frame(rna, start, code.stops)]
+
+def _frame_columns(rna: str | PackedSequence, start: int, code: GeneticCode) -> tuple[bytes, str]:
+  """
+  Indeks kodon (0..63, satu byte per kodon) mulai dari <code>start</code> hingga stop codon pertama (inklusif),
+  beserta kode satu huruf asam aminonya sebagai satu <code>str</code> (<code>*</code> untuk stop).
+  """
+  if isinstance(rna, PackedSequence):
+    indices = bytearray()
+    for index in rna.codons(start):
+      indices.append(index)
+      if code.is_stop[index]:
+        break
+  elif numpy_backend.HAS_NUMPY and len(rna) - start >= numpy_backend.MIN_LENGTH:
+    array = numpy_backend.frame_indices(rna, start, code.is_stop)
+    return array.astype("uint8").tobytes(), numpy_backend.letters(array, code.letters)
+  else:
+    indices = bytes([_CODON_INDEX[codon] for codon in _reading_frame(rna, start, code.stops)])
+  return bytes(indices), indices.decode("latin-1").translate(code.letters_table)
+
+# ! windowed input
+def _checked_windows(
+  windows: Iterator[str],
+  validator: BaseValidator,
+  error: type[MoleculeStructureError],
+  message: ErrorMessage
+  ) -> Iterator[str]:
+  """
+  Validasi tiap jendela tepat sebelum dipakai, dengan posisi basa yang tidak valid dihitung dari awal
+  jendela pertama. Jendela yang tidak pernah diminta tidak divalidasi.
+  """
+  offset = 0
+  for seq in windows:
+    invalid = validator.report(seq, offset=offset)
+    if invalid:
+      raise error(
+        message=f"{message.value}: {invalid}",
+        status_code=400
+      )
+    offset += len(seq)
+    yield seq
+
+def _translate_windows(
+  windows: Iterator[str],
+  code: GeneticCode,
+  name_index: int,
+  alternative_starts: bool
+  ) -> Iterator[list[str]]:
+  """
+  Mentranslasikan RNA yang datang per jendela (valid, huruf besar, urutan baca 5\' ke 3\'). Hanya sisa
+  jendela sebelumnya (calon start codon atau kodon yang belum lengkap) yang disimpan. Menghasilkan asam amino
+  per jendela hingga stop codon pertama (inklusif); setelah itu jendela berikutnya tidak diminta lagi.
+  
+  ### Raises:
+    - **NoStartCodonError:**
+      Jika tidak ada start codon di seluruh jendela
+  """
+  carry, started = "", False
+  for seq in windows:
+    seq, start = carry + seq, 0
+    if not started:
+      start = _find_start(seq, code, alternative_starts)
+      if start == -1:
+        carry = seq[-2:]
+        continue
+    
+    end = start + (len(seq) - start) // 3 * 3
+    proteins = _translate_frame(seq[:end], start, code, name_index)
+    carry = seq[end:]
+    if not started and alternative_starts:
+      # start codon apa pun diterjemahkan sebagai Met (inisiator)
+      proteins[0] = _PROTEIN_CODON_REV_MAP[_START_CODON][name_index]
+    started = True
+    
+    yield proteins
+    if proteins and proteins[-1] == "Stop":
+      return
+  
+  if not started:
+    raise NoStartCodonError(
+      message=ErrorMessage.START_CODON_NOT_FOUND.value,
+      status_code=400
+    )
+
+# ! open reading frames
+def _scan_frame(rna: str, frame: int, name_index: int, min_length: int) -> Iterator[tuple[int, int, list[str]]]:
+  """
+  Memindai satu reading frame sekali jalan dan menghasilkan <code>(start, end, proteins)</code> untuk setiap ORF,
+  yaitu dari start codon pertama setelah stop codon sebelumnya hingga stop codon berikutnya (inklusif).
+  ORF di ujung sequence yang tidak memiliki stop codon tetap dihasilkan. ORF dengan jumlah asam amino
+  (tanpa stop) kurang dari <code>min_length</code> dibuang.
+  """
+  start, proteins = -1, []
+  for i in range(frame, len(rna) - 2, 3):
+    codon = rna[i:i+3]
+    if start == -1:
+      if codon == _START_CODON:
+        start, proteins = i, [_PROTEIN_CODON_REV_MAP[codon][name_index]]
+      continue
+    
+    proteins.append(_PROTEIN_CODON_REV_MAP[codon][name_index])
+    if codon in _STOP_CODONS:
+      if len(proteins) - 1 >= min_length:
+        yield start, i + 3, proteins
+      start = -1
+  
+  if start != -1 and len(proteins) >= min_length:
+    yield start, start + len(proteins) * 3, proteins
+
+def find_orfs(
+  rna: str,
+  read_from: str = "5",
+  to: str = "3",
+  naming_type: str = "3 letters",
+  min_length: int = 0
+  ) -> FindOrfsResult:
+  """
+  Mencari semua open reading frame (ORF) pada keenam reading frame RNA: tiga frame pada untai yang diberikan
+  (dibaca dari ujung 5\' ke 3\') dan tiga frame pada komplemen baliknya. Setiap frame dipindai satu kali.
+  
+  Posisi <code>start</code> dan <code>end</code> (0-based, <code>end</code> eksklusif) selalu dihitung pada untai
+  yang diberikan setelah diformat menjadi 5\' ke 3\'.
+  
+  ### Returns:
+  FindOrfsResult
+  
+  ### Raises:
+    - **InvalidStrandReadError:**
+      Jika RNA dibaca dengan arah yang tidak valid. Arah yang diizinkan adalah (3,5) atau (5,3)
+    - **InvalidRnaError:**
+      Jika RNA mengandung basa nitrogen yang tidak valid. Basa nitrogen yang valid adalah `A`, `U`, `G`, dan `C`
+  """
+  
+  if (read_from, to) not in _VALID_EDGES:
+    raise InvalidStrandReadError(
+      message=invalid_edge_message((read_from, to)),
+      status_code=400
+    )
+  
+  invalid = _RNA_VALIDATOR.report(rna)
+  if invalid:
+    message = f"{ErrorMessage.RNA_HAS_INVALID_BASE.value}: {invalid}"
+    raise InvalidRnaError(
+      message=message,
+      status_code=400
+    )
+  
+  name_index, delim, naming_type = _naming(naming_type)
+  
+  rna = rna.upper()
+  # balik urutan RNA-nya jika ia dibaca dari ujung 3' ke ujung 5'
+  rna = rna[::-1] if (read_from, to) == ("3", "5") else rna
+  length = len(rna)
+  
+  orfs: list[OrfResult] = []
+  for strand, seq in (("+", rna), ("-", rna.translate(_RNA_COMPLEMENT_TABLE)[::-1])):
+    for frame in range(3):
+      for start, end, proteins in _scan_frame(seq, frame, name_index, min_length):
+        has_stop_codon = proteins[-1] == "Stop"
+        sequence = delim.join(proteins)
+        orfs.append({
+          "strand" : strand,
+          "frame" : frame + 1,
+          "start" : start if strand == "+" else length - end,
+          "end" : end if strand == "+" else length - start,
+          "proteins" : proteins,
+          "sequence" : sequence if has_stop_codon else (sequence + delim),
+          "has_stop_codon" : has_stop_codon
+        })
+  
+  return {
+    "naming_type" : naming_type,
+    "min_length" : min_length,
+    "orfs" : orfs
+  }
+
 # ! transcribe
 def transcribe(
-  dna: str,
+  dna: str | PackedSequence,
   read_from: str = "3",
-  to: str = "5"
+  to: str = "5",
+  include_full_sequence: bool = True,
+  executor: Executor | None = None,
+  timeout: float | None = None
   ) -> TranscribeResult:
   """
-  Mentranskripsikan sebuah DNA menjadi RNA, dibaca dari ujung <code>read_from</code> ke ujung <code>to</code> menghasilkan RNA dengan ujung <code>to</code> di kiri dan 
-  <code>read_from di kanan</code>.
+  Mentranskripsikan sebuah DNA (<code>str</code> atau <code>PackedSequence</code>) menjadi RNA, dibaca dari ujung <code>read_from</code> ke ujung <code>to</code> menghasilkan RNA dengan ujung <code>to</code> di kiri dan 
+  <code>read_from di kanan</code>. <code>full_sequence</code> hanya disertakan jika <code>include_full_sequence</code> bernilai True.
+  Jika <code>executor</code> (process pool) diberikan, DNA <code>str</code> dikomplemen per chunk secara paralel
+  dan ditunggu paling lama <code>timeout</code> detik (lihat <code>dna.parallel</code>). Pemanggil yang menentukan
+  kapan sequence cukup panjang untuk dibagi (lihat <code>parallel.MIN_LENGTH</code>).
   
   ### Returns:
   TranscribeResult
@@ -76,43 +372,66 @@ def transcribe(
     - **InvalidDnaResult:**
       Jika DNA mengandung basa nitrogen yang tidak valid. Basa nitrogen yang valid adalah `A`, `T`, `G`, dan `C`
   """
-  dna = dna.upper()
   if (read_from, to) not in _VALID_EDGES:
     raise InvalidStrandReadError(
       message=invalid_edge_message((read_from, to)),
       status_code=400
     )
   
-  if not all(base in _VALID_DNA_BASES for base in dna):
-    invalid_bases = ", ".join([base for base in dna if base not in _VALID_DNA_BASES])
-    message = f"{ErrorMessage.DNA_HAS_INVALID_BASE.value}: {invalid_bases}"
-    raise InvalidDnaError(
-      message=message,
-      status_code=400
-    )
+  if isinstance(dna, PackedSequence):
+    # sudah valid saat dipack, komplemen dihitung langsung pada bentuk packed
+    _check_packed_kind(dna, "DNA")
+    seq = dna.complement().as_kind("RNA").to_str()
+  else:
+    seq = None
+    if executor is not None:
+      seq = parallel.complement(dna, _TRANSCRIBE_BYTES, _VALID_DNA_BYTES, executor, timeout=timeout)
+    if seq is None:
+      invalid = _DNA_VALIDATOR.report(dna)
+      if invalid:
+        message = f"{ErrorMessage.DNA_HAS_INVALID_BASE.value}: {invalid}"
+        raise InvalidDnaError(
+          message=message,
+          status_code=400
+        )
+      seq = dna.translate(_TRANSCRIBE_TABLE)
   
   read_from, to = to, read_from
-  seq = "".join(_BASE_PAIRS.get(base.upper(), "?") for base in dna)
-  return {
+  result: TranscribeResult = {
     "nucleic_acid_type" : "RNA",
-    "full_sequence" : f"{read_from}\'-{seq}-{to}\'",
     "sequence" : seq,
     "read_from" : read_from,
-    "to" : to,
+    "to" : to
   }
+  # full_sequence is a second copy of the whole sequence, callers may skip it
+  if include_full_sequence:
+    result["full_sequence"] = f"{read_from}\'-{seq}-{to}\'"
+  return result
 
 # ! translate
 def translate(
-  rna: str,
+  rna: str | PackedSequence,
   read_from: str = "5",
   to: str = "3",
-  naming_type: str = "3 letters"
-  ) -> TranslateResult:
+  naming_type: str = "3 letters",
+  genetic_code: int = STANDARD,
+  alternative_starts: bool = False,
+  output_format: str = "list"
+  ) -> TranslateResult | TranslateColumnarResult:
   """
   Mentranslasikan sebuah RNA menjadi urutan asam amino, dibaca dari ujung 5\' ke ujung 3\'. 
+  RNA boleh berupa <code>str</code> atau <code>PackedSequence</code> (kind <code>RNA</code>).
+  <code>genetic_code</code> adalah nomor tabel translasi NCBI (default 1, Standard). Jika <code>alternative_starts</code>
+  bernilai True, translasi dimulai dari start codon pertama milik tabel tersebut (mis. GUG, UUG) dan
+  asam amino pertamanya selalu Met; jika tidak, hanya AUG yang dianggap start codon.
+  
+  Dengan <code>output_format="columnar"</code> hasilnya berbentuk kolom, bukan satu <code>str</code> per residu:
+  <code>start</code> (posisi start codon; kodon ke-i berada di <code>start + 3*i</code>), <code>codon_indices</code>
+  (base64, satu byte <code>16*a + 4*b + c</code> per kodon dengan U=0, C=1, A=2, G=3) dan <code>amino_acids</code> (kode satu huruf, <code>*</code> untuk stop).
+  <code>naming_type</code> diabaikan. Posisi dihitung pada RNA setelah diformat menjadi 5\' ke 3\'.
   
   ### Return:
-  TranslateResult
+  TranslateResult | TranslateColumnarResult
   
   ### Raises:
     - **InvalidStrandReadError:**
@@ -121,59 +440,72 @@ def translate(
       Jika RNA mengandung basa nitrogen yang tidak valid. Basa nitrogen yang valid adalah `A`, `U`, `G`, dan `C`
     - **NoStartCodonError:**
       Jika RNA tidak memiliki start codon (AUG) setelah diformat sehingga dibaca dari ujung 5' ke 3'
+    - **InvalidGeneticCodeError:**
+      Jika <code>genetic_code</code> bukan tabel translasi NCBI yang didukung
   """
   
-  rna = rna.upper()
+  code = get_code(genetic_code)
   if (read_from, to) not in _VALID_EDGES:
     raise InvalidStrandReadError(
       message=invalid_edge_message((read_from, to)),
       status_code=400
     )
-    
-  if not all(base in _VALID_RNA_BASES for base in rna):
-    invalid_bases = ", ".join([base for base in rna if base not in _VALID_RNA_BASES])
-    message = f"{ErrorMessage.RNA_HAS_INVALID_BASE.value}: {invalid_bases}"
-    raise InvalidRnaError(
-      message=message,
-      status_code=400
-    )
   
-  name_index, delim = 1, "-"
-  match naming_type:
-    case "short":
-      name_index, delim = 0, ""
-    case "3 letters":
-      name_index, delim = 1, "-"
-    case "long":
-      name_index, delim = 2, "---"
-    case _:
-      naming_type = "3 letters"
+  is_packed = isinstance(rna, PackedSequence)
+  if is_packed:
+    _check_packed_kind(rna, "RNA")
+  else:
+    invalid = _RNA_VALIDATOR.report(rna)
+    if invalid:
+      message = f"{ErrorMessage.RNA_HAS_INVALID_BASE.value}: {invalid}"
+      raise InvalidRnaError(
+        message=message,
+        status_code=400
+      )
+  
+  name_index, delim, naming_type = _naming(naming_type)
   
+  rna = rna if is_packed else rna.upper()
   # balik urutan RNA-nya jika ia dibaca dari ujung 3' ke ujung 5'
   rna = rna[::-1] if (read_from, to) == ("3", "5") else rna
   
-  if _START_CODON not in rna:
+  # find the first occurance of start codon
+  if is_packed and alternative_starts:
+    start = min((index for index in map(rna.find, code.starts) if index != -1), default=-1)
+  else:
+    start = _find_start(rna, code, alternative_starts)
+  if start == -1:
     raise NoStartCodonError(
       message=ErrorMessage.START_CODON_NOT_FOUND.value,
       status_code=400
     )
   
-  start = rna.index(_START_CODON) # find the first occurance of start codon
-  rna = rna[start:] # cut at start codon
-  rna = rna[:(len(rna) - len(rna) % 3)] # make it divisible by 3
-  triplets = [rna[i:i+3] for i in range(0, len(rna), 3)]
+  if output_format == "columnar":
+    indices, amino_acids = _frame_columns(rna, start, code)
+    if alternative_starts:
+      amino_acids = "M" + amino_acids[1:]
+    return {
+      "output_format" : "columnar",
+      "start" : start,
+      "codon_indices" : base64.b64encode(indices).decode("ascii"),
+      "amino_acids" : amino_acids,
+      "has_stop_codon" : amino_acids.endswith("*")
+    }
   
-  stop_indices = [index for index, stop in enumerate(triplets)
-                  if stop in _STOP_CODONS] # find all stop codon indices
-  end = min(stop_indices) + 1 if stop_indices else len(triplets)
-  # get the first stop codon
+  if is_packed:
+    # kodon dibaca langsung dari bentuk packed sebagai indeks 0..63
+    names, proteins = code.names[name_index], []
+    for index in rna.codons(start):
+      proteins.append(names[index])
+      if code.is_stop[index]:
+        break
+  else:
+    proteins = _translate_frame(rna, start, code, name_index)
   
-  triplets = triplets[:end] 
-  # take only codons between the start and stop codon
-  # else if no stop codons, get all codons
+  if alternative_starts:
+    # start codon apa pun diterjemahkan sebagai Met (inisiator)
+    proteins[0] = _PROTEIN_CODON_REV_MAP[_START_CODON][name_index]
   
-  proteins = [_PROTEIN_CODON_REV_MAP.get(codon, "?")[name_index] for codon in triplets]
-  # convert codon into its amino acid, then list them
   has_stop_codon = "Stop" in proteins
   sequence = delim.join(proteins)
   return {
@@ -183,14 +515,83 @@ def translate(
     "has_stop_codon" : has_stop_codon,
   }
 
+# ! transcribe and translate
+def _template_windows(dna: str, reverse: bool) -> Iterator[str]:
+  """Jendela DNA dalam urutan baca (dari ujung kanan dan dibalik jika <code>reverse</code>), dengan ukuran yang bertambah."""
+  position, window, length = 0, numpy_backend.FIRST_WINDOW, len(dna)
+  while position < length:
+    if reverse:
+      yield dna[max(length - position - window, 0):length - position][::-1]
+    else:
+      yield dna[position:position + window]
+    position += window
+    window = min(window * 2, numpy_backend.MAX_WINDOW)
+
+def dna_to_protein(
+  dna: str,
+  read_from: str = "3",
+  to: str = "5",
+  naming_type: str = "3 letters",
+  genetic_code: int = STANDARD,
+  alternative_starts: bool = False
+  ) -> TranslateResult:
+  """
+  Transkripsi lalu translasi dalam satu langkah, hasilnya sama dengan
+  <code>translate(transcribe(dna, read_from, to)["sequence"], to, read_from, ...)</code>.
+  RNA tidak pernah dibuat utuh: DNA template dibaca per jendela dalam urutan baca RNA, tiap jendela
+  dikomplemen saat kodonnya dibutuhkan, dan pembacaan berhenti pada stop codon pertama sehingga basa
+  setelahnya tidak disentuh (juga tidak divalidasi).
+  
+  ### Returns:
+  TranslateResult
+  
+  ### Raises:
+    - **InvalidStrandReadError:**
+      Jika DNA dibaca dengan arah yang tidak valid. Arah yang diizinkan adalah (3,5) atau (5,3)
+    - **InvalidDnaError:**
+      Jika DNA yang dibaca mengandung basa nitrogen yang tidak valid. Posisi dihitung sesuai urutan baca
+    - **NoStartCodonError:**
+      Jika RNA hasil transkripsi tidak memiliki start codon
+    - **InvalidGeneticCodeError:**
+      Jika <code>genetic_code</code> bukan tabel translasi NCBI yang didukung
+  """
+  code = get_code(genetic_code)
+  if (read_from, to) not in _VALID_EDGES:
+    raise InvalidStrandReadError(
+      message=invalid_edge_message((read_from, to)),
+      status_code=400
+    )
+  
+  name_index, delim, naming_type = _naming(naming_type)
+  
+  # RNA hasil transkripsi berlabel (to, read_from); dibaca 5' ke 3' berarti DNA dibalik jika read_from = 5
+  windows = _template_windows(dna, reverse=(read_from, to) == ("5", "3"))
+  windows = _checked_windows(windows, _DNA_VALIDATOR, InvalidDnaError, ErrorMessage.DNA_HAS_INVALID_BASE)
+  rna_windows = (seq.translate(_TRANSCRIBE_TABLE) for seq in windows)
+  proteins = [protein for chunk in _translate_windows(rna_windows, code, name_index, alternative_starts) for protein in chunk]
+  
+  has_stop_codon = bool(proteins) and proteins[-1] == "Stop"
+  sequence = delim.join(proteins)
+  return {
+    "naming_type" : naming_type,
+    "proteins" : proteins,
+    "sequence" : sequence if has_stop_codon else (sequence + delim),
+    "has_stop_codon" : has_stop_codon,
+  }
+
 # ! transcribe RNA to DNA
 def rna_to_dna(
-  rna: str,
+  rna: str | PackedSequence,
   read_from: str = "5",
-  to: str = "3"
+  to: str = "3",
+  include_full_sequence: bool = True,
+  executor: Executor | None = None,
+  timeout: float | None = None
   ) -> RnaToDnaResult:
   """
-  Mengubah RNA ke DNA.
+  Mengubah RNA (<code>str</code> atau <code>PackedSequence</code>) ke DNA. <code>full_sequence</code> hanya disertakan jika <code>include_full_sequence</code> bernilai True.
+  Jika <code>executor</code> (process pool) diberikan, RNA <code>str</code> dikomplemen per chunk secara paralel
+  dan ditunggu paling lama <code>timeout</code> detik.
   
   ### Returns:
   RnaToDnaResult
@@ -202,38 +603,63 @@ def rna_to_dna(
       Jika RNA mengandung basa nitrogen yang tidak valid. Basa nitrogen yang valid adalah `A`, `U`, `G`, dan `C`
   """
   
-  rna = rna.upper()
   if (read_from, to) not in _VALID_EDGES:
     raise InvalidStrandReadError(
       message=invalid_edge_message((read_from, to)),
       status_code=400
     )
   
-  if not all(base in _VALID_RNA_BASES for base in rna):
-    invalid_bases = ", ".join([base for base in rna if base not in _VALID_RNA_BASES])
-    message = f"{ErrorMessage.RNA_HAS_INVALID_BASE.value}: {invalid_bases}"
-    raise InvalidRnaError(
-      message=message,
-      status_code=400
-    )
+  if isinstance(rna, PackedSequence):
+    _check_packed_kind(rna, "RNA")
+    seq = rna.complement().as_kind("DNA").to_str()
+  else:
+    seq = None
+    if executor is not None:
+      seq = parallel.complement(rna, _RNA_TO_DNA_BYTES, _VALID_RNA_BYTES, executor, timeout=timeout)
+    if seq is None:
+      invalid = _RNA_VALIDATOR.report(rna)
+      if invalid:
+        message = f"{ErrorMessage.RNA_HAS_INVALID_BASE.value}: {invalid}"
+        raise InvalidRnaError(
+          message=message,
+          status_code=400
+        )
+      seq = rna.translate(_RNA_TO_DNA_TABLE)
   
   read_from, to = to, read_from
-  seq = "".join(_BASE_PAIRS_REV_MAP[base] for base in rna)
-  return {
+  result: RnaToDnaResult = {
     "nucleic_acid_type" : "DNA",
-    "full_sequence" : f"{read_from}\'-{seq}-{to}\'",
     "sequence" : seq,
     "read_from" : read_from,
     "to" : to
   }
+  # full_sequence is a second copy of the whole sequence, callers may skip it
+  if include_full_sequence:
+    result["full_sequence"] = f"{read_from}\'-{seq}-{to}\'"
+  return result
 
 # ! codon to protein
+def _codon_error(codon: str) -> InvalidCodonError:
+  """Buat error untuk kodon yang tidak ada di tabel (panjang atau basa nitrogen tidak valid)."""
+  if len(codon) != 3:
+    return InvalidCodonError(
+      message=ErrorMessage.INVALID_CODON_LENGTH.value,
+      status_code=400
+    )
+  
+  message = f"{ErrorMessage.CODON_HAS_INVALID_BASE.value}: {_RNA_VALIDATOR.report(codon)}"
+  return InvalidCodonError(
+    message=message,
+    status_code=400
+  )
+
 def codon_to_protein(
   codon: str,
   naming_type: str = "3 letters"
   ) -> CodonToProteinResult:
   """
-  Mengonversi kodon menjadi asam aminonya.
+  Mengonversi kodon menjadi asam aminonya. Hasil diambil dari tabel yang sudah dirender saat import,
+  sehingga hasil yang dikembalikan dipakai bersama dan tidak boleh diubah.
   
   ### Returns:
   CodonToProteinResult
@@ -244,34 +670,209 @@ def codon_to_protein(
   </code>
   """
   
-  codon = codon.upper()
-  if len(codon) != 3:
-    raise InvalidCodonError(
-      message=ErrorMessage.INVALID_CODON_LENGTH.value,
+  responses = _CODON_RESPONSES.get(naming_type, _DEFAULT_CODON_RESPONSES)
+  result = responses.get(codon)
+  if result is None:
+    codon = codon.upper()
+    result = responses.get(codon)
+    if result is None:
+      raise _codon_error(codon)
+  return result
+
+def codons_to_proteins(
+  codons: list[str],
+  naming_type: str = "3 letters"
+  ) -> CodonsToProteinsResult:
+  """
+  Mengonversi banyak kodon sekaligus menjadi asam aminonya, dengan urutan yang sama seperti <code>codons</code>.
+  
+  ### Returns:
+  CodonsToProteinsResult
+  
+  ### Raises:
+    - **InvalidCodonError:**
+      Jika salah satu kodon memiliki panjang atau basa nitrogen yang tidak valid
+  """
+  
+  responses = _CODON_RESPONSES.get(naming_type, _DEFAULT_CODON_RESPONSES)
+  results = []
+  for codon in codons:
+    result = responses.get(codon) or responses.get(codon.upper())
+    if result is None:
+      raise _codon_error(codon.upper())
+    results.append(result)
+  
+  return {
+    "naming_type" : naming_type if naming_type in _CODON_RESPONSES else "3 letters",
+    "results" : results
+  }
+
+# ! sequence files
+@contextmanager
+def _mapped_file(path: str | os.PathLike) -> Iterator[mmap.mmap | bytes]:
+  """Petakan file ke memori (read-only). File kosong tidak bisa di-mmap, jadi diganti <code>b""</code>."""
+  with open(path, "rb") as file:
+    if os.fstat(file.fileno()).st_size == 0:
+      yield b""
+      return
+    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+      yield mapped
+
+@contextmanager
+def _output_file(path: str | os.PathLike, overwrite: bool = True) -> Iterator[IO[str]]:
+  """
+  Tulis ke file sementara baru di folder yang sama lalu ganti <code>path</code> jika berhasil; file sementara
+  dihapus jika gagal. File sementara dibuat eksklusif dengan nama acak (O_EXCL, O_NOFOLLOW), jadi tidak
+  pernah mengikuti symlink dan dua proses dengan <code>path</code> yang sama tidak saling menimpa.
+  Tanpa <code>overwrite</code>, <code>path</code> yang sudah ada tidak pernah ditimpa (FileExistsError), juga jika
+  file itu baru dibuat selama proses berjalan.
+  """
+  if not overwrite and os.path.lexists(path):
+    raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), os.fspath(path))
+  part = f"{os.fspath(path)}.{os.urandom(8).hex()}.part"
+  flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_NOFOLLOW", 0)
+  fd = os.open(part, flags, 0o666)
+  try:
+    with open(fd, "w", encoding="ascii") as file:
+      yield file
+    if overwrite:
+      os.replace(part, path)
+    else:
+      # link fails if path appeared in the meantime, unlike replace
+      os.link(part, path)
+      os.remove(part)
+  except BaseException:
+    with suppress(FileNotFoundError):
+      os.remove(part)
+    raise
+
+def _file_windows(mapped: mmap.mmap | bytes, window: int, reverse: bool = False) -> Iterator[str]:
+  """
+  Menghasilkan isi file per jendela <code>window</code> byte tanpa whitespace. Baris header FASTA (<code>></code>)
+  di awal file dilewati. Jika <code>reverse</code> bernilai True, jendela dibaca dari akhir file dan isinya dibalik.
+  """
+  begin = 0
+  if mapped[:1] == b">":
+    newline = mapped.find(b"\n")
+    begin = len(mapped) if newline == -1 else newline + 1
+  
+  if reverse:
+    for end in range(len(mapped), begin, -window):
+      yield mapped[max(end - window, begin):end].translate(None, _WHITESPACE)[::-1].decode("latin-1")
+  else:
+    for offset in range(begin, len(mapped), window):
+      yield mapped[offset:offset + window].translate(None, _WHITESPACE).decode("latin-1")
+
+def transcribe_file(
+  source: str | os.PathLike,
+  target: str | os.PathLike,
+  read_from: str = "3",
+  to: str = "5",
+  overwrite: bool = True,
+  window: int = FILE_WINDOW
+  ) -> TranscribeFileResult:
+  """
+  Mentranskripsikan DNA dari file <code>source</code> (sequence polos atau satu record FASTA, boleh dipisah baris)
+  ke file <code>target</code>. File dibaca lewat <code>mmap</code> per jendela <code>window</code> byte, sehingga
+  sequence tidak pernah disimpan utuh sebagai <code>str</code>. <code>target</code> baru muncul setelah semua
+  jendela berhasil diproses, dan hanya menimpa file yang sudah ada jika <code>overwrite</code> bernilai True.
+  
+  ### Returns:
+  TranscribeFileResult
+  
+  ### Raises:
+    - **InvalidStrandReadError:**
+      Jika DNA dibaca dengan arah yang tidak valid. Arah yang diizinkan adalah (3,5) atau (5,3)
+    - **InvalidDnaError:**
+      Jika DNA mengandung basa nitrogen yang tidak valid. Posisi dihitung pada sequence tanpa whitespace
+    - **FileExistsError:**
+      Jika <code>target</code> sudah ada dan <code>overwrite</code> bernilai False
+    - **OSError:**
+      Jika <code>source</code> tidak bisa dibaca atau <code>target</code> tidak bisa ditulis
+  """
+  if (read_from, to) not in _VALID_EDGES:
+    raise InvalidStrandReadError(
+      message=invalid_edge_message((read_from, to)),
       status_code=400
     )
   
-  if not all(base in _VALID_RNA_BASES for base in codon):
-    invalid_bases = ", ".join([base for base in codon if base not in _VALID_RNA_BASES])
-    message = f"{ErrorMessage.CODON_HAS_INVALID_BASE.value}: {invalid_bases}"
-    raise InvalidCodonError(
-      message=message,
+  length = 0
+  with _mapped_file(source) as mapped, _output_file(target, overwrite) as output:
+    windows = _file_windows(mapped, window)
+    for seq in _checked_windows(windows, _DNA_VALIDATOR, InvalidDnaError, ErrorMessage.DNA_HAS_INVALID_BASE):
+      output.write(seq.translate(_TRANSCRIBE_TABLE))
+      length += len(seq)
+  
+  read_from, to = to, read_from
+  return {
+    "nucleic_acid_type" : "RNA",
+    "path" : os.fspath(target),
+    "length" : length,
+    "read_from" : read_from,
+    "to" : to
+  }
+
+def translate_file(
+  source: str | os.PathLike,
+  target: str | os.PathLike,
+  read_from: str = "5",
+  to: str = "3",
+  naming_type: str = "3 letters",
+  genetic_code: int = STANDARD,
+  alternative_starts: bool = False,
+  overwrite: bool = True,
+  window: int = FILE_WINDOW
+  ) -> TranslateFileResult:
+  """
+  Mentranslasikan RNA dari file <code>source</code> ke file <code>target</code>, hasilnya sama dengan
+  <code>sequence</code> milik <code>translate</code>. File dibaca lewat <code>mmap</code> per jendela
+  <code>window</code> byte (dari akhir file jika dibaca dari ujung 3\' ke 5\'), dan pembacaan berhenti
+  pada stop codon pertama sehingga basa setelahnya tidak disentuh (juga tidak divalidasi). File yang sudah ada
+  hanya ditimpa jika <code>overwrite</code> bernilai True.
+  
+  ### Returns:
+  TranslateFileResult
+  
+  ### Raises:
+    - **InvalidStrandReadError:**
+      Jika RNA dibaca dengan arah yang tidak valid. Arah yang diizinkan adalah (3,5) atau (5,3)
+    - **InvalidRnaError:**
+      Jika RNA mengandung basa nitrogen yang tidak valid. Posisi dihitung pada sequence tanpa whitespace, sesuai arah baca
+    - **NoStartCodonError:**
+      Jika RNA tidak memiliki start codon
+    - **InvalidGeneticCodeError:**
+      Jika <code>genetic_code</code> bukan tabel translasi NCBI yang didukung
+    - **FileExistsError:**
+      Jika <code>target</code> sudah ada dan <code>overwrite</code> bernilai False
+    - **OSError:**
+      Jika <code>source</code> tidak bisa dibaca atau <code>target</code> tidak bisa ditulis
+  """
+  code = get_code(genetic_code)
+  if (read_from, to) not in _VALID_EDGES:
+    raise InvalidStrandReadError(
+      message=invalid_edge_message((read_from, to)),
       status_code=400
     )
-    
-  name_index = 1
-  match naming_type:
-    case "short": name_index = 0
-    case "3 letters": name_index = 1
-    case "long": name_index = 2
-    case _: naming_type = "3 letters"
   
-  protein = _PROTEIN_CODON_REV_MAP.get(codon)
-  synonymous_codons = list(_PROTEIN_CODON.get(protein))
-  protein = protein[name_index] if protein else None
+  name_index, delim, naming_type = _naming(naming_type)
+  
+  reverse = (read_from, to) == ("3", "5")
+  length, has_stop_codon = 0, False
+  with _mapped_file(source) as mapped, _output_file(target, overwrite) as output:
+    windows = _file_windows(mapped, window, reverse)
+    windows = _checked_windows(windows, _RNA_VALIDATOR, InvalidRnaError, ErrorMessage.RNA_HAS_INVALID_BASE)
+    for proteins in _translate_windows(map(str.upper, windows), code, name_index, alternative_starts):
+      if proteins:
+        output.write((delim if length else "") + delim.join(proteins))
+        length += len(proteins)
+        has_stop_codon = proteins[-1] == "Stop"
+    
+    if not has_stop_codon:
+      output.write(delim)
   
   return {
     "naming_type" : naming_type,
-    "protein" : "No result" if protein is None else protein,
-    "synonymous_codons" : "No result" if synonymous_codons is None else synonymous_codons
+    "path" : os.fspath(target),
+    "length" : length,
+    "has_stop_codon" : has_stop_codon
   }
@@ -6,6 +6,9 @@ class ErrorMessage(Enum):
   RNA_HAS_INVALID_BASE = "RNA contains invalid base(s)"
   INVALID_CODON_LENGTH = "Codon length must be 3"
   CODON_HAS_INVALID_BASE = "Codon contains invalid base(s)"
+  INVALID_FASTA_FORMAT = "Invalid FASTA/FASTQ format"
+  RECORD_TOO_LONG = "Record is too long"
+  UNKNOWN_GENETIC_CODE = "Unknown genetic code (NCBI translation table)"
 
 def invalid_edge_message(pair: tuple[int, int]) -> str:
   return f"Edge pair is invalid: {pair}"
@@ -4,6 +4,10 @@ class MoleculeStructureError(Exception):
     super().__init__(message)
     self.status_code = status_code
 
+  def __reduce__(self):
+    # keep status_code when the error is pickled back from a worker process
+    return (type(self), (self.args[0], self.status_code))
+
 class InvalidDnaError(MoleculeStructureError):
   """Raised when DNA contains invalid character"""
   pass
@@ -24,3 +28,11 @@ class InvalidStrandReadError(MoleculeStructureError):
 class NoStartCodonError(MoleculeStructureError):
   """Raised when RNA has no start codon"""
   pass
+
+class InvalidFastaError(MoleculeStructureError):
+  """Raised when a FASTA/FASTQ stream is malformed"""
+  pass
+
+class InvalidGeneticCodeError(MoleculeStructureError):
+  """Raised when the requested NCBI translation table is not supported"""
+  pass
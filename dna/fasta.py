@@ -0,0 +1,92 @@
+"""
+Incremental FASTA/FASTQ reader.
+
+Records are parsed line by line from a binary stream, so only the record being
+read is held in memory. The format is detected from the first non-empty line
+(`>` for FASTA, `@` for FASTQ). FASTQ records must use the usual four-line
+layout; quality lines are skipped.
+
+With `max_length` the memory per record is bounded as well, which matters for
+gzipped uploads whose decompressed size is not known up front: every line is
+read with a bounded `readline`, and a record longer than `max_length` bases is
+skipped instead of being built (it is reported with a `None` sequence).
+"""
+from typing import BinaryIO, Iterator
+from dna.error_enum import ErrorMessage
+from dna.error_types import InvalidFastaError
+
+def _invalid(detail: str) -> InvalidFastaError:
+  return InvalidFastaError(
+    message=f"{ErrorMessage.INVALID_FASTA_FORMAT.value}: {detail}",
+    status_code=400
+  )
+
+_SKIP_SIZE = 1 << 20 # bytes read at a time while skipping the rest of an overlong line
+
+def _lines(stream: BinaryIO, max_length: int | None = None) -> Iterator[str]:
+  """
+  Yield stripped, non-empty lines of `stream` decoded as ASCII. A line longer than
+  `max_length` is cut just after `max_length` characters and the rest is skipped,
+  so the caller still sees it is too long.
+  """
+  limit = -1 if max_length is None else max_length + 2 # room for "\r\n"
+  while True:
+    line = stream.readline(limit)
+    if not line:
+      return
+    if len(line) == limit and not line.endswith(b"\n"):
+      rest = line
+      while rest and not rest.endswith(b"\n"):
+        rest = stream.readline(_SKIP_SIZE)
+    line = line.strip()
+    if line:
+      try:
+        yield line.decode("ascii")
+      except UnicodeDecodeError:
+        raise _invalid("non-ASCII data") from None
+
+def _read_fasta(first: str, lines: Iterator[str], max_length: int | None) -> Iterator[tuple[str, str | None]]:
+  header, chunks, length = first[1:], [], 0
+  for line in lines:
+    if line.startswith(">"):
+      yield header, "".join(chunks) if max_length is None or length <= max_length else None
+      header, chunks, length = line[1:], [], 0
+      continue
+    length += len(line)
+    # past the limit the record is only counted, its lines are dropped
+    if max_length is None or length <= max_length:
+      chunks.append(line)
+  yield header, "".join(chunks) if max_length is None or length <= max_length else None
+
+def _read_fastq(first: str, lines: Iterator[str], max_length: int | None) -> Iterator[tuple[str, str | None]]:
+  header = first
+  while header is not None:
+    if not header.startswith("@"):
+      raise _invalid(f"expected '@' header, got {header[:20]!r}")
+    sequence = next(lines, None)
+    separator = next(lines, None)
+    quality = next(lines, None)
+    if quality is None or not separator.startswith("+"):
+      raise _invalid(f"truncated record {header[1:21]!r}")
+    yield header[1:], sequence if max_length is None or len(sequence) <= max_length else None
+    header = next(lines, None)
+
+def read_records(stream: BinaryIO, max_length: int | None = None) -> Iterator[tuple[str, str | None]]:
+  """
+  Read `(header, sequence)` pairs from a FASTA or FASTQ byte stream, one record at a time.
+  The sequence is `None` for a record longer than `max_length` bases.
+  
+  ### Raises:
+    - **InvalidFastaError:**
+      If the stream is neither FASTA nor FASTQ, is not ASCII or ends mid-record
+  """
+  lines = _lines(stream, max_length)
+  first = next(lines, None)
+  if first is None:
+    return
+  if first.startswith(">"):
+    yield from _read_fasta(first, lines, max_length)
+  elif first.startswith("@"):
+    yield from _read_fastq(first, lines, max_length)
+  else:
+    raise _invalid("records must start with '>' or '@'")
@@ -0,0 +1,213 @@
+"""
+NCBI genetic codes (translation tables).
+
+Each table is stored in the NCBI `gc.prt` layout: 64 amino acids (`*` = stop)
+and 64 start flags (`M` = start), in `TCAG` order. That order is exactly the
+codon index `16*a + 4*b + c` used by `dna.numpy_backend` and `dna.packed`, so a
+compiled table is just flat 64-entry lookups that every translation path can
+share. Tables are compiled on first use and cached, so choosing a table per
+request costs one dict lookup.
+
+Tables 27, 28 and 31, whose stop codons depend on context, are not included.
+"""
+import re
+from functools import lru_cache
+from typing import NamedTuple
+from dna.error_enum import ErrorMessage
+from dna.error_types import InvalidGeneticCodeError
+
+STANDARD = 1
+CODON_BASES = "UCAG"
+CODONS = tuple(a + b + c for a in CODON_BASES for b in CODON_BASES for c in CODON_BASES)
+
+AMINO_ACID_NAMES = {
+  "A" : ("A", "Ala", "Alanine"),
+  "R" : ("R", "Arg", "Arginine"),
+  "N" : ("N", "Asn", "Asparagine"),
+  "D" : ("D", "Asp", "Aspartic Acid"),
+  "C" : ("C", "Cys", "Cysteine"),
+  "Q" : ("Q", "Gln", "Glutamine"),
+  "E" : ("E", "Glu", "Glutamic Acid"),
+  "G" : ("G", "Gly", "Glycine"),
+  "H" : ("H", "His", "Histidine"),
+  "I" : ("I", "Ile", "Isoleucine"),
+  "L" : ("L", "Leu", "Leucine"),
+  "K" : ("K", "Lys", "Lysine"),
+  "M" : ("M", "Met", "Methionine"),
+  "F" : ("F", "Phe", "Phenylalanine"),
+  "P" : ("P", "Pro", "Proline"),
+  "S" : ("S", "Ser", "Serine"),
+  "T" : ("T", "Thr", "Threonine"),
+  "W" : ("W", "Trp", "Tryptophan"),
+  "Y" : ("Y", "Tyr", "Tyrosine"),
+  "V" : ("V", "Val", "Valine"),
+  "*" : ("Stop", "Stop", "Stop")
+}
+
+# id -> (name, amino acids, starts)
+NCBI_TABLES = {
+  1 : (
+    "Standard",
+    "FFLLSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+    "---M---------------M---------------M----------------------------"
+  ),
+  2 : (
+    "Vertebrate Mitochondrial",
+    "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIMMTTTTNNKKSS**VVVVAAAADDEEGGGG",
+    "--------------------------------MMMM---------------M------------"
+  ),
+  3 : (
+    "Yeast Mitochondrial",
+    "FFLLSSSSYY**CCWWTTTTPPPPHHQQRRRRIIMMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+    "----------------------------------MM---------------M------------"
+  ),
+  4 : (
+    "Mold Mitochondrial",
+    "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+    "--MM---------------M------------MMMM---------------M------------"
+  ),
+  5 : (
+    "Invertebrate Mitochondrial",
+    "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIMMTTTTNNKKSSSSVVVVAAAADDEEGGGG",
+    "---M----------------------------MMMM---------------M------------"
+  ),
+  6 : (
+    "Ciliate Nuclear",
+    "FFLLSSSSYYQQCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+    "-----------------------------------M----------------------------"
+  ),
+  9 : (
+    "Echinoderm Mitochondrial",
+    "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNNKSSSSVVVVAAAADDEEGGGG",
+    "-----------------------------------M---------------M------------"
+  ),
+  10 : (
+    "Euplotid Nuclear",
+    "FFLLSSSSYY**CCCWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+    "-----------------------------------M----------------------------"
+  ),
+  11 : (
+    "Bacterial",
+    "FFLLSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+    "---M---------------M------------MMMM---------------M------------"
+  ),
+  12 : (
+    "Alternative Yeast Nuclear",
+    "FFLLSSSSYY**CC*WLLLSPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+    "-------------------M---------------M----------------------------"
+  ),
+  13 : (
+    "Ascidian Mitochondrial",
+    "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIMMTTTTNNKKSSGGVVVVAAAADDEEGGGG",
+    "---M------------------------------MM---------------M------------"
+  ),
+  14 : (
+    "Alternative Flatworm Mitochondrial",
+    "FFLLSSSSYYY*CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNNKSSSSVVVVAAAADDEEGGGG",
+    "-----------------------------------M----------------------------"
+  ),
+  15 : (
+    "Blepharisma Macronuclear",
+    "FFLLSSSSYY*QCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+    "-----------------------------------M----------------------------"
+  ),
+  16 : (
+    "Chlorophycean Mitochondrial",
+    "FFLLSSSSYY*LCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+    "-----------------------------------M----------------------------"
+  ),
+  21 : (
+    "Trematode Mitochondrial",
+    "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIMMTTTTNNNKSSSSVVVVAAAADDEEGGGG",
+    "-----------------------------------M---------------M------------"
+  ),
+  22 : (
+    "Scenedesmus obliquus Mitochondrial",
+    "FFLLSS*SYY*LCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+    "-----------------------------------M----------------------------"
+  ),
+  23 : (
+    "Thraustochytrium Mitochondrial",
+    "FF*LSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+    "--------------------------------M--M---------------M------------"
+  ),
+  24 : (
+    "Pterobranchia Mitochondrial",
+    "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSSKVVVVAAAADDEEGGGG",
+    "---M---------------M---------------M---------------M------------"
+  ),
+  25 : (
+    "Candidate Division SR1",
+    "FFLLSSSSYY**CCGWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+    "---M-------------------------------M---------------M------------"
+  ),
+  26 : (
+    "Pachysolen tannophilus Nuclear",
+    "FFLLSSSSYY**CC*WLLLAPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+    "-------------------M---------------M----------------------------"
+  ),
+  29 : (
+    "Mesodinium Nuclear",
+    "FFLLSSSSYYYYCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+    "-----------------------------------M----------------------------"
+  ),
+  30 : (
+    "Peritrich Nuclear",
+    "FFLLSSSSYYEECC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+    "-----------------------------------M----------------------------"
+  ),
+  32 : (
+    "Balanophoraceae Plastid",
+    "FFLLSSSSYY*WCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+    "---M---------------M------------MMMM---------------M------------"
+  ),
+  33 : (
+    "Cephalodiscidae Mitochondrial",
+    "FFLLSSSSYYY*CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSSKVVVVAAAADDEEGGGG",
+    "---M---------------M---------------M---------------M------------"
+  ),
+}
+
+class GeneticCode(NamedTuple):
+  """A compiled translation table. Every tuple is indexed by codon index (0..63)."""
+  id: int
+  name: str
+  names: tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]] # per naming index: short, 3 letters, long
+  letters: str # one-letter code per codon index, `*` for stop
+  letters_table: dict[int, str] # `str.translate` table from chr(codon index) to its letter
+  is_stop: tuple[bool, ...]
+  codon_names: dict[str, tuple[str, str, str]] # codon -> (short, 3 letters, long)
+  starts: frozenset[str]
+  stops: frozenset[str]
+  start_pattern: re.Pattern # finds the first start codon of this table
+
+@lru_cache(maxsize=None)
+def get_code(table_id: int = STANDARD) -> GeneticCode:
+  """
+  Compiled translation table for an NCBI table id.
+  
+  ### Raises:
+    - **InvalidGeneticCodeError:**
+      If `table_id` is not a supported NCBI table
+  """
+  if table_id not in NCBI_TABLES:
+    raise InvalidGeneticCodeError(
+      message=f"{ErrorMessage.UNKNOWN_GENETIC_CODE.value}: {table_id}",
+      status_code=400
+    )
+  
+  name, amino_acids, start_flags = NCBI_TABLES[table_id]
+  codon_names = { codon: AMINO_ACID_NAMES[amino_acid] for codon, amino_acid in zip(CODONS, amino_acids) }
+  starts = frozenset(codon for codon, flag in zip(CODONS, start_flags) if flag == "M")
+  return GeneticCode(
+    id=table_id,
+    name=name,
+    names=tuple(tuple(codon_names[codon][index] for codon in CODONS) for index in range(3)),
+    letters=amino_acids,
+    letters_table=str.maketrans(dict(zip(map(chr, range(64)), amino_acids))),
+    is_stop=tuple(amino_acid == "*" for amino_acid in amino_acids),
+    codon_names=codon_names,
+    starts=starts,
+    stops=frozenset(codon for codon, amino_acid in zip(CODONS, amino_acids) if amino_acid == "*"),
+    start_pattern=re.compile("|".join(sorted(starts)))
+  )
@@ -0,0 +1,97 @@
+"""
+Optional NumPy backend for codon translation.
+
+Bases are encoded as 2-bit integers (`U`=0, `C`=1, `A`=2, `G`=3), so every codon
+`abc` maps to a flat index `16*a + 4*b + c` in the range 0..63. Translation then
+becomes a couple of array lookups instead of one dict lookup per codon.
+
+NumPy is not a hard dependency; check `HAS_NUMPY` before calling into this module.
+"""
+from functools import lru_cache
+
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
+HAS_NUMPY = np is not None
+CODON_BASES = "UCAG"
+MIN_LENGTH = 3_000 # below this the pure Python path is faster
+# windows that double in size up to MAX_WINDOW, so an early stop codon only touches a few kilobases
+FIRST_WINDOW = 3 * 1_024 # bases, must stay divisible by 3
+MAX_WINDOW = 3 * 262_144
+
+if HAS_NUMPY:
+  _BASE_CODES = np.zeros(256, dtype=np.intp)
+  for code, base in enumerate(CODON_BASES):
+    _BASE_CODES[ord(base)] = code
+
+@lru_cache(maxsize=None)
+def _as_array(values: tuple, dtype: type) -> "np.ndarray":
+  """Convert (and cache) a 64-entry lookup tuple into a NumPy array."""
+  array = np.empty(len(values), dtype=dtype)
+  array[:] = values
+  return array
+
+def codon_indices(rna: str) -> "np.ndarray":
+  """
+  Encode an upper-case, validated RNA whose length is divisible by 3 into codon indices.
+  
+  ### Returns:
+  ```
+  np.ndarray[np.intp]  # one index (0..63) per codon
+  ```
+  """
+  codes = _BASE_CODES[np.frombuffer(rna.encode("ascii"), dtype=np.uint8)].reshape(-1, 3)
+  return codes[:, 0] * 16 + codes[:, 1] * 4 + codes[:, 2]
+
+def frame_indices(
+  rna: str,
+  start: int,
+  stops: tuple[bool, ...]
+  ) -> "np.ndarray":
+  """
+  Codon indices of the reading frame that begins at `start`, up to and including its
+  first stop codon. The frame is encoded in geometrically growing windows, so an early
+  stop codon only costs a small window instead of the whole sequence.
+  
+  ### Returns:
+  ```
+  np.ndarray[np.intp]  # one index (0..63) per codon
+  ```
+  """
+  stop_table = _as_array(stops, bool)
+  end = start + (len(rna) - start) // 3 * 3
+  window = FIRST_WINDOW
+  chunks = []
+  while start < end:
+    indices = codon_indices(rna[start:min(start + window, end)])
+    is_stop = stop_table[indices]
+    if is_stop.any():
+      chunks.append(indices[:int(is_stop.argmax()) + 1])
+      break
+    chunks.append(indices)
+    start += window
+    window = min(window * 2, MAX_WINDOW)
+  return np.concatenate(chunks) if chunks else np.empty(0, dtype=np.intp)
+
+def letters(indices: "np.ndarray", table: str) -> str:
+  """One character of the 64-character `table` per codon index, as one string."""
+  return _as_array(tuple(table.encode("ascii")), np.uint8)[indices].tobytes().decode("ascii")
+
+def translate_frame(
+  rna: str,
+  start: int,
+  names: tuple[str, ...],
+  stops: tuple[bool, ...]
+  ) -> list[str]:
+  """
+  Translate the reading frame that begins at `start` up to and including its first stop codon
+  (see `frame_indices`). `names` and `stops` are 64-entry lookups indexed by codon index.
+  
+  ### Returns:
+  ```
+  list[str]  # amino acid name per codon
+  ```
+  """
+  return _as_array(names, object)[frame_indices(rna, start, stops)].tolist()
@@ -0,0 +1,226 @@
+"""
+2-bit packed nucleotide sequences.
+
+Bases use the same codes as `dna.numpy_backend` (`T`/`U`=0, `C`=1, `A`=2, `G`=3),
+four per byte with the first base in the two highest bits, so a packed sequence
+takes a quarter of the memory of the equivalent `str`. With this layout the
+complement of a base is `code ^ 2` and three consecutive codes form the codon
+index `16*a + 4*b + c` used by the translation lookups.
+
+Packing and unpacking run in C: bases are mapped to base-4 digits and parsed with
+`int(..., 4)`, and unpacking translates the packed bytes once per base position
+(`bytes.translate`) and interleaves the four results with strided slice assignment.
+"""
+from typing import Iterator
+from dna.error_enum import ErrorMessage
+from dna.error_types import InvalidDnaError, InvalidRnaError
+from dna.validation import BaseValidator
+
+ALPHABETS = {
+  "DNA" : "TCAG",
+  "RNA" : "UCAG"
+}
+_ERRORS = {
+  "DNA" : (InvalidDnaError, ErrorMessage.DNA_HAS_INVALID_BASE),
+  "RNA" : (InvalidRnaError, ErrorMessage.RNA_HAS_INVALID_BASE)
+}
+_FIND_WINDOW = 1 << 16 # bases unpacked at a time by `find`
+
+def _digit_table(alphabet: str) -> dict[int, str]:
+  table = str.maketrans(alphabet, "0123")
+  table.update(str.maketrans(alphabet.lower(), "0123"))
+  return table
+
+def _unpack_tables(alphabet: str) -> tuple[bytes, ...]:
+  """One `bytes.translate` table per base position in a byte, mapping the byte to that base's letter."""
+  return tuple(bytes(ord(alphabet[byte >> shift & 3]) for byte in range(256)) for shift in (6, 4, 2, 0))
+
+def _reverse_byte(byte: int) -> int:
+  return ((byte & 3) << 6) | ((byte >> 2 & 3) << 4) | ((byte >> 4 & 3) << 2) | (byte >> 6)
+
+_DIGIT_TABLES = { kind: _digit_table(alphabet) for kind, alphabet in ALPHABETS.items() }
+_VALIDATORS = { kind: BaseValidator(alphabet) for kind, alphabet in ALPHABETS.items() }
+_UNPACK_TABLES = { kind: _unpack_tables(alphabet) for kind, alphabet in ALPHABETS.items() }
+_COMPLEMENT_BYTES = bytes(byte ^ 0xAA for byte in range(256))
+_REVERSE_BYTES = bytes(_reverse_byte(byte) for byte in range(256))
+
+class PackedSequence:
+  """
+  Immutable DNA or RNA sequence stored with 2 bits per base.
+  
+  Supports `len`, indexing, slicing with step 1 or -1, `complement`, `reverse`
+  and codon iteration without unpacking the whole sequence.
+  """
+  __slots__ = ("kind", "_data", "_length")
+  
+  def __init__(self, data: bytes, length: int, kind: str = "DNA"):
+    if kind not in ALPHABETS:
+      raise ValueError(f"Unknown sequence kind: {kind}")
+    self.kind = kind
+    self._data = bytes(data)
+    self._length = length
+  
+  # ! construction
+  @classmethod
+  def from_str(cls, sequence: str, kind: str = "DNA") -> "PackedSequence":
+    """
+    Pack a DNA (`ATGC`) or RNA (`AUGC`) string, in any case.
+    
+    ### Raises:
+      - **InvalidDnaError / InvalidRnaError:**
+        If `sequence` contains a base that is not valid for `kind`
+    """
+    if kind not in ALPHABETS:
+      raise ValueError(f"Unknown sequence kind: {kind}")
+    invalid = _VALIDATORS[kind].report(sequence)
+    if invalid:
+      error, message = _ERRORS[kind]
+      raise error(
+        message=f"{message.value}: {invalid}",
+        status_code=400
+      )
+    return cls._from_digits(sequence.translate(_DIGIT_TABLES[kind]), kind)
+  
+  @classmethod
+  def _from_digits(cls, digits: str, kind: str) -> "PackedSequence":
+    length = len(digits)
+    if length == 0:
+      return cls(b"", 0, kind)
+    digits += "0" * (-length % 4)
+    return cls(int(digits, 4).to_bytes(len(digits) // 4, "big"), length, kind)
+  
+  @classmethod
+  def _from_int(cls, value: int, length: int, kind: str) -> "PackedSequence":
+    """Pack the `length` bases held in the low `2*length` bits of `value`."""
+    value <<= 2 * (-length % 4)
+    return cls(value.to_bytes((length + 3) // 4, "big"), length, kind)
+  
+  # ! conversion
+  def to_str(self) -> str:
+    """Unpack into an upper-case string."""
+    data = self._data
+    letters = bytearray(len(data) * 4)
+    for position, table in enumerate(_UNPACK_TABLES[self.kind]):
+      letters[position::4] = data.translate(table)
+    return letters[:self._length].decode("ascii")
+  
+  def to_bytes(self) -> bytes:
+    """The packed data: four bases per byte, first base in the two highest bits, zero padded."""
+    return self._data
+  
+  def as_kind(self, kind: str) -> "PackedSequence":
+    """Same bases read as `kind` (`T` <-> `U`), without copying the packed data."""
+    return type(self)(self._data, self._length, kind)
+  
+  def __str__(self) -> str:
+    return self.to_str()
+  
+  def __repr__(self) -> str:
+    preview = self[:20].to_str() + ("..." if self._length > 20 else "")
+    return f"PackedSequence({preview!r}, length={self._length}, kind={self.kind!r})"
+  
+  def __len__(self) -> int:
+    return self._length
+  
+  def __eq__(self, other: object) -> bool:
+    if not isinstance(other, PackedSequence):
+      return NotImplemented
+    return (self.kind, self._length, self._data) == (other.kind, other._length, other._data)
+  
+  def __hash__(self) -> int:
+    return hash((self.kind, self._length, self._data))
+  
+  def __getstate__(self):
+    return (self.kind, self._data, self._length)
+  
+  def __setstate__(self, state) -> None:
+    self.kind, self._data, self._length = state
+  
+  @property
+  def nbytes(self) -> int:
+    """Size of the packed data in bytes."""
+    return len(self._data)
+  
+  # ! access
+  def code(self, index: int) -> int:
+    """2-bit code of the base at `index`."""
+    if index < 0:
+      index += self._length
+    if not 0 <= index < self._length:
+      raise IndexError("PackedSequence index out of range")
+    return self._data[index >> 2] >> (6 - 2 * (index & 3)) & 3
+  
+  def __getitem__(self, key: int | slice):
+    if isinstance(key, int):
+      return ALPHABETS[self.kind][self.code(key)]
+    
+    start, stop, step = key.indices(self._length)
+    if step == -1:
+      return self[stop + 1:start + 1].reverse()
+    if step != 1:
+      return type(self).from_str(self.to_str()[key], self.kind)
+    if stop <= start:
+      return type(self)(b"", 0, self.kind)
+    if start == 0 and stop == self._length:
+      return self
+    
+    # unpack only the bytes that hold [start, stop)
+    chunk = self._data[start >> 2:((stop - 1) >> 2) + 1]
+    length = stop - start
+    trailing = len(chunk) * 4 - (start & 3) - length
+    value = int.from_bytes(chunk, "big") >> 2 * trailing
+    return type(self)._from_int(value & ((1 << 2 * length) - 1), length, self.kind)
+  
+  # ! operations
+  def complement(self) -> "PackedSequence":
+    """Base-wise complement (`A` <-> `T`/`U`, `G` <-> `C`), same orientation."""
+    data = bytearray(self._data.translate(_COMPLEMENT_BYTES))
+    padding = -self._length % 4
+    if padding:
+      data[-1] &= (0xFF << 2 * padding) & 0xFF # keep the padding bits zero
+    return type(self)(data, self._length, self.kind)
+  
+  def reverse(self) -> "PackedSequence":
+    """The bases in reverse order."""
+    if self._length == 0:
+      return self
+    data = self._data[::-1].translate(_REVERSE_BYTES)
+    padding = -self._length % 4
+    if not padding:
+      return type(self)(data, self._length, self.kind)
+    # the padding bits are now in front, shift them out
+    value = int.from_bytes(data, "big") & ((1 << 2 * self._length) - 1)
+    return type(self)._from_int(value, self._length, self.kind)
+  
+  def reverse_complement(self) -> "PackedSequence":
+    return self.reverse().complement()
+  
+  def find(self, sub: str, start: int = 0) -> int:
+    """Index of the first occurrence of `sub` at or after `start`, or -1, like `str.find`. Unpacks in windows."""
+    if start < 0:
+      start = max(start + self._length, 0)
+    if not sub:
+      return start if start <= self._length else -1
+    overlap = len(sub) - 1
+    sub = sub.upper()
+    for offset in range(start, self._length, _FIND_WINDOW):
+      index = self[offset:offset + _FIND_WINDOW + overlap].to_str().find(sub)
+      if index != -1:
+        return offset + index
+    return -1
+  
+  def codons(self, start: int = 0) -> Iterator[int]:
+    """
+    Yield the codon index (`16*a + 4*b + c`, 0..63) of every complete codon in the
+    reading frame that begins at `start`.
+    """
+    frame = self[start:]
+    data, count = frame._data, len(frame) // 3
+    for offset in range(0, len(data), 3):
+      # 3 bytes hold exactly 4 codons
+      value = int.from_bytes(data[offset:offset + 3].ljust(3, b"\0"), "big")
+      for shift in (18, 12, 6, 0):
+        if count == 0:
+          return
+        yield value >> shift & 63
+        count -= 1
@@ -1,9 +1,9 @@
-from typing import TypedDict
+from typing import NotRequired, TypedDict
 
 # ! base type
 class StranToStrandResult(TypedDict):
   nucleic_acid_type : str
-  full_sequence: str
+  full_sequence: NotRequired[str]
   sequence: str
   read_from: str
   to: str
@@ -58,6 +58,25 @@ class TranslateResult(ToProteinResult):
   sequence: str
   has_stop_codon: bool
 
+class TranslateColumnarResult(TypedDict):
+  """
+  ### Value:
+  ```
+  {
+    "output_format" : "columnar",
+    "start" : int,  # codon i starts at start + 3*i
+    "codon_indices" : str,  # base64, one byte 16*a + 4*b + c per codon (U=0, C=1, A=2, G=3)
+    "amino_acids" : str,  # one letter per codon, "*" for stop
+    "has_stop_codon" : bool
+  }
+  ```
+  """
+  output_format: str
+  start: int
+  codon_indices: str
+  amino_acids: str
+  has_stop_codon: bool
+
 class CodonToProteinResult(ToProteinResult):
   """
   ### Value:
@@ -70,4 +89,88 @@ class CodonToProteinResult(ToProteinResult):
   ```
   """
   protein: str
-  synonymous_codons: list[str]
+  synonymous_codons: tuple[str, ...]
+
+class CodonsToProteinsResult(ToProteinResult):
+  """
+  ### Value:
+  ```
+  {
+    "naming_type" : str,
+    "results" : list[CodonToProteinResult]
+  }
+  ```
+  """
+  results: list[CodonToProteinResult]
+
+class OrfResult(TypedDict):
+  """
+  ### Value:
+  ```
+  {
+    "strand" : str,
+    "frame" : int,
+    "start" : int,
+    "end" : int,
+    "proteins" : list[str],
+    "sequence" : str,
+    "has_stop_codon" : bool
+  }
+  ```
+  """
+  strand: str
+  frame: int
+  start: int
+  end: int
+  proteins: list[str]
+  sequence: str
+  has_stop_codon: bool
+
+class FindOrfsResult(ToProteinResult):
+  """
+  ### Value:
+  ```
+  {
+    "naming_type" : str,
+    "min_length" : int,
+    "orfs" : list[OrfResult]
+  }
+  ```
+  """
+  min_length: int
+  orfs: list[OrfResult]
+
+class TranscribeFileResult(TypedDict):
+  """
+  ### Value:
+  ```
+  {
+    "nucleic_acid_type" : str,
+    "path" : str,
+    "length" : int,
+    "read_from" : str,
+    "to" : str
+  }
+  ```
+  """
+  nucleic_acid_type: str
+  path: str
+  length: int
+  read_from: str
+  to: str
+
+class TranslateFileResult(ToProteinResult):
+  """
+  ### Value:
+  ```
+  {
+    "naming_type" : str,
+    "path" : str,
+    "length" : int,
+    "has_stop_codon" : bool
+  }
+  ```
+  """
+  path: str
+  length: int
+  has_stop_codon: bool
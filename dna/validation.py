@@ -0,0 +1,47 @@
+"""
+Single-pass base validation with bounded error reports.
+
+A valid sequence costs one `str.translate` pass that deletes every valid base.
+Only when something is left over is the sequence scanned again, and only up to
+the first `MAX_REPORTED_POSITIONS` offending positions, so an N-rich region of
+millions of bases produces a short message instead of listing every character.
+"""
+import re
+from itertools import islice
+
+MAX_REPORTED_POSITIONS = 10
+MAX_REPORTED_CHARACTERS = 10
+
+class BaseValidator:
+  """Validator for one alphabet (e.g. `"ATGC"`), case-insensitive."""
+  __slots__ = ("bases", "_strip_table", "_invalid_pattern")
+  
+  def __init__(self, bases: str):
+    chars = bases.upper() + bases.lower()
+    self.bases = bases.upper()
+    self._strip_table = str.maketrans("", "", chars)
+    self._invalid_pattern = re.compile(f"[^{re.escape(chars)}]")
+  
+  def is_valid(self, seq: str) -> bool:
+    return not seq.translate(self._strip_table)
+  
+  def report(self, seq: str, offset: int = 0) -> str:
+    """
+    Describe the invalid bases of `seq`, or return an empty string when it is valid.
+    Positions are shifted by `offset`, for `seq` being a window of a longer sequence.
+    
+    ### Returns:
+    ```
+    "N, X (12 in total, first at 3 'N', 4 'N', 9 'X')"
+    ```
+    """
+    invalid = seq.translate(self._strip_table)
+    if not invalid:
+      return ""
+    
+    chars = sorted(set(invalid.upper()))
+    listed = ", ".join(chars[:MAX_REPORTED_CHARACTERS]) + (", ..." if len(chars) > MAX_REPORTED_CHARACTERS else "")
+    matches = islice(self._invalid_pattern.finditer(seq), MAX_REPORTED_POSITIONS)
+    positions = ", ".join(f"{match.start() + offset} {match.group()!r}" for match in matches)
+    more = ", ..." if len(invalid) > MAX_REPORTED_POSITIONS else ""
+    return f"{listed} ({len(invalid)} in total, first at {positions}{more})"
@@ -1,17 +1,56 @@
-from pydantic import BaseModel
+from typing import Annotated, Any, Literal
+from pydantic import AfterValidator, BaseModel, Field, model_validator
+from dna.genetic_code import NCBI_TABLES, STANDARD
+
+MAX_SEQUENCE_LENGTH = 100_000_000
+
+Edge = Literal["3", "5"]
+NamingType = Literal["short", "3 letters", "long"]
+OutputFormat = Literal["list", "columnar"]
+
+def _check_genetic_code(value: int) -> int:
+  if value not in NCBI_TABLES:
+    raise ValueError(f"Unknown genetic code (NCBI translation table): {value}")
+  return value
+
+# NCBI translation table id, also checked where the field is optional (None skips the check)
+GeneticCode = Annotated[int, AfterValidator(_check_genetic_code)]
 
 # ! base DTO and content
 class BaseDto(BaseModel):
   action: str
   molecule_type: str
 
-class BaseStrandReqContent(BaseModel):
-  sequence: str
-  read_from: str
-  to: str
+def _check_edge_pair(read_from: Edge, to: Edge) -> None:
+  # (3, 5) or (5, 3) only, so dna_tools never sees an invalid pair from the API
+  if read_from == to:
+    raise ValueError(f"Edge pair is invalid: {(read_from, to)}")
+
+class StrandEdges(BaseModel):
+  read_from: Edge
+  to: Edge
+  
+  @model_validator(mode="after")
+  def check_edges(self):
+    _check_edge_pair(self.read_from, self.to)
+    return self
+
+class BaseStrandReqContent(StrandEdges):
+  sequence: str = Field(max_length=MAX_SEQUENCE_LENGTH)
+
+class BaseFileReqContent(StrandEdges):
+  # paths are relative to the server's configured data directory
+  source: str = Field(min_length=1)
+  target: str = Field(min_length=1)
+  # an existing target is only replaced when asked for explicitly
+  overwrite: bool = False
 
 class ToProteinOperation(BaseModel):
-  naming_type: str
+  naming_type: NamingType
+
+class GeneticCodeOption(BaseModel):
+  genetic_code: GeneticCode = STANDARD
+  alternative_starts: bool = False
 
 # ! content
 class TranscribeReqContent(BaseStrandReqContent):
@@ -44,7 +83,7 @@ class RnaToDnaReqContent(BaseStrandReqContent):
   """
   pass
 
-class TranslateReqContent(BaseStrandReqContent, ToProteinOperation):
+class TranslateReqContent(BaseStrandReqContent, ToProteinOperation, GeneticCodeOption):
   """
   Content that will be used for translate method.
   
@@ -54,7 +93,28 @@ class TranslateReqContent(BaseStrandReqContent, ToProteinOperation):
     "sequence" : str,
     "read_from" : str,
     "to" : str
-    "naming_type" : str
+    "naming_type" : str,
+    "genetic_code" : int,  # NCBI translation table, default 1
+    "alternative_starts" : bool,  # default false (AUG only)
+    "output_format" : str  # "list" (default) or "columnar"
+  }
+  ```
+  """
+  output_format: OutputFormat = "list"
+
+class DnaToProteinReqContent(BaseStrandReqContent, ToProteinOperation, GeneticCodeOption):
+  """
+  Content that will be used for transcribing and translating a DNA template in one step.
+  
+  ### Value:
+  ```
+  {
+    "sequence" : str,
+    "read_from" : str,
+    "to" : str,
+    "naming_type" : str,
+    "genetic_code" : int,  # NCBI translation table, default 1
+    "alternative_starts" : bool  # default false (AUG only)
   }
   ```
   """
@@ -74,6 +134,74 @@ class CodonToProteinContent(ToProteinOperation):
   """
   codon: str
 
+class CodonsToProteinsContent(ToProteinOperation):
+  """
+  Content that will be used for converting many codons to amino acids at once.
+  
+  ### Value:
+  ```
+  {
+    "naming_type" : str,
+    "codons" : list[str]
+  }
+  ```
+  """
+  codons: list[str] = Field(max_length=10_000)
+
+class FindOrfsReqContent(BaseStrandReqContent, ToProteinOperation):
+  """
+  Content that will be used for finding ORFs in all six reading frames.
+  
+  ### Value:
+  ```
+  {
+    "sequence" : str,
+    "read_from" : str,
+    "to" : str,
+    "naming_type" : str,
+    "min_length" : int  # optional, minimum amino acids per ORF (default 0)
+  }
+  ```
+  """
+  min_length: int = Field(default=0, ge=0)
+
+class TranscribeFileReqContent(BaseFileReqContent):
+  """
+  Content that will be used for transcribing a DNA file on the server.
+  
+  ### Value:
+  ```
+  {
+    "source" : str,
+    "target" : str,
+    "overwrite" : bool,  # default false: an existing target is refused
+    "read_from" : str,
+    "to" : str
+  }
+  ```
+  """
+  pass
+
+class TranslateFileReqContent(BaseFileReqContent, ToProteinOperation, GeneticCodeOption):
+  """
+  Content that will be used for translating an RNA file on the server.
+  
+  ### Value:
+  ```
+  {
+    "source" : str,
+    "target" : str,
+    "overwrite" : bool,  # default false: an existing target is refused
+    "read_from" : str,
+    "to" : str,
+    "naming_type" : str,
+    "genetic_code" : int,  # NCBI translation table, default 1
+    "alternative_starts" : bool  # default false (AUG only)
+  }
+  ```
+  """
+  pass
+
 # ! DTO
 class TranscribeReqDto(BaseDto):
   """
@@ -120,6 +248,21 @@ class RnaToDnaReqDto(BaseDto):
   """
   content: RnaToDnaReqContent
 
+class DnaToProteinReqDto(BaseDto):
+  """
+  DTO for converting a DNA template straight to amino acids sequence.
+  
+  ### Value:
+  ```
+  {
+    "action" : str,
+    "molecule_type" : str,
+    "content" : DnaToProteinReqContent
+  }
+  ```
+  """
+  content: DnaToProteinReqContent
+
 class CodonToProteinReqDto(BaseDto):
   """
   DTO for converting codon to protein.
@@ -134,3 +277,118 @@ class CodonToProteinReqDto(BaseDto):
   ```
   """
   content: CodonToProteinContent
+
+class CodonsToProteinsReqDto(BaseDto):
+  """
+  DTO for converting many codons to proteins.
+  
+  ### Value:
+  ```
+  {
+    "action" : str,
+    "molecule_type" : str,
+    "content" : CodonsToProteinsContent
+  }
+  ```
+  """
+  content: CodonsToProteinsContent
+
+class FindOrfsReqDto(BaseDto):
+  """
+  DTO for finding every ORF of an RNA in all six reading frames.
+  
+  ### Value:
+  ```
+  {
+    "action" : str,
+    "molecule_type" : str,
+    "content" : FindOrfsReqContent
+  }
+  ```
+  """
+  content: FindOrfsReqContent
+
+class TranscribeFileReqDto(BaseDto):
+  """
+  DTO for transcribing a DNA file on the server into an RNA file.
+  
+  ### Value:
+  ```
+  {
+    "action" : str,
+    "molecule_type" : str,
+    "content" : TranscribeFileReqContent
+  }
+  ```
+  """
+  content: TranscribeFileReqContent
+
+class TranslateFileReqDto(BaseDto):
+  """
+  DTO for translating an RNA file on the server into an amino acids file.
+  
+  ### Value:
+  ```
+  {
+    "action" : str,
+    "molecule_type" : str,
+    "content" : TranslateFileReqContent
+  }
+  ```
+  """
+  content: TranslateFileReqContent
+
+class BatchReqDto(BaseModel):
+  """
+  DTO for batch request: run many operations in one request. Every operation
+  is validated against the DTO matching its `action` when it is processed, so an
+  invalid operation (even one that is not an object) only fails its own item.
+  
+  ### Value:
+  ```
+  {
+    "operations" : list[
+      TranscribeReqDto | TranslateReqDto | RnaToDnaReqDto | CodonToProteinReqDto
+      | CodonsToProteinsReqDto | FindOrfsReqDto | DnaToProteinReqDto
+    ]
+  }
+  ```
+  """
+  operations: list[Any] = Field(max_length=10_000)
+
+class FastaReqParams(BaseModel):
+  """
+  Query parameters for the FASTA/FASTQ upload endpoint. Unset edges and naming
+  type fall back to the defaults of the chosen operation; the edges are given
+  both or neither.
+  
+  ### Value:
+  ```
+  {
+    "action" : "transcribe" | "translate",
+    "read_from" : str | None,
+    "to" : str | None,
+    "naming_type" : str | None,
+    "genetic_code" : int | None,  # translate only
+    "alternative_starts" : bool | None,  # translate only
+    "output_format" : str | None,  # translate only
+    "full_sequence" : bool  # transcribe only, default true
+  }
+  ```
+  """
+  action: Literal["transcribe", "translate"]
+  read_from: Edge | None = None
+  to: Edge | None = None
+  naming_type: NamingType | None = None
+  genetic_code: GeneticCode | None = None
+  alternative_starts: bool | None = None
+  output_format: OutputFormat | None = None
+  full_sequence: bool = True
+  
+  @model_validator(mode="after")
+  def check_edges(self):
+    if (self.read_from is None) != (self.to is None):
+      raise ValueError("read_from and to must be given together")
+    if self.read_from is not None:
+      _check_edge_pair(self.read_from, self.to)
+    return self
@@ -1,10 +1,90 @@
 from flask import Flask
 from flask_cors import CORS
+from flaskr import admin
+from flaskr import admission
+from flaskr import executor
+from flaskr import json_provider
+from flaskr import metrics
+from flaskr import middleware
 
-def create_app():
+CORS_RESOURCES = [r"/api/*", r"/metrics"]
+
+def configure(
+  pool_size: int = 0,
+  pool_threshold: int = 100_000,
+  pool_timeout: float | None = 30.0,
+  pool_split_threshold: int = 8_000_000,
+  cache_entries: int = 1_024,
+  cache_bytes: int = 64 * 1024 * 1024,
+  enable_metrics: bool = False,
+  data_dir: str | None = None,
+  max_body_bytes: int | None = 128 * 1024 * 1024,
+  body_limits: dict[str, int] | None = None,
+  work_budget: int = 0,
+  retry_after: int = 1
+  ) -> None:
+  """Configure the process pool, result cache, metrics, file directory and admission control shared by the WSGI and ASGI apps."""
+  # sequences of at least `pool_threshold` bases run on `pool_size` worker processes,
+  # transcribe/rna-to-dna of at least `pool_split_threshold` bases are split across all of them
+  executor.configure(
+    pool_size=pool_size,
+    threshold=pool_threshold,
+    timeout=pool_timeout,
+    split_threshold=pool_split_threshold
+  )
+  # repeated identical requests are answered from an LRU cache, 0 entries disables it
+  middleware.result_cache.configure(
+    max_entries=cache_entries,
+    max_bytes=cache_bytes
+  )
+  # per-stage timings, sequence lengths and error counts at /metrics
+  metrics.configure(enable_metrics)
+  # sequence files under `data_dir` can be processed in place at /admin/files/*, None disables it
+  admin.configure(data_dir)
+  # bodies above `max_body_bytes` (or the per-path `body_limits`) get 413; once `work_budget`
+  # bases are in flight further requests get 503 with Retry-After, 0 disables shedding
+  admission.configure(
+    max_body=max_body_bytes,
+    body_limits=body_limits,
+    work_budget=work_budget,
+    retry_after_seconds=retry_after
+  )
+
+def create_app(
+  pool_size: int = 0,
+  pool_threshold: int = 100_000,
+  pool_timeout: float | None = 30.0,
+  pool_split_threshold: int = 8_000_000,
+  cache_entries: int = 1_024,
+  cache_bytes: int = 64 * 1024 * 1024,
+  enable_metrics: bool = False,
+  data_dir: str | None = None,
+  max_body_bytes: int | None = 128 * 1024 * 1024,
+  body_limits: dict[str, int] | None = None,
+  work_budget: int = 0,
+  retry_after: int = 1
+  ):
   # create and configure the app
   app = Flask(__name__)
-  CORS(app=app)
+  # orjson-backed jsonify and streamed responses, the stdlib json module when orjson is not installed
+  app.json = json_provider.FastJSONProvider(app)
+  # the public API only: /admin is for trusted callers and must not be reachable from browsers
+  CORS(app=app, resources=CORS_RESOURCES)
+  configure(
+    pool_size=pool_size,
+    pool_threshold=pool_threshold,
+    pool_timeout=pool_timeout,
+    pool_split_threshold=pool_split_threshold,
+    cache_entries=cache_entries,
+    cache_bytes=cache_bytes,
+    enable_metrics=enable_metrics,
+    data_dir=data_dir,
+    max_body_bytes=max_body_bytes,
+    body_limits=body_limits,
+    work_budget=work_budget,
+    retry_after=retry_after
+  )
+  app.config["MAX_CONTENT_LENGTH"] = max_body_bytes
 
   # a simple endpoint that says hello
   @app.route('/')
@@ -13,5 +93,11 @@ def create_app():
     
   from flaskr import resource
   app.register_blueprint(resource.bp)
+  
+  if enable_metrics:
+    app.register_blueprint(metrics.bp)
+  
+  if data_dir is not None:
+    app.register_blueprint(admin.bp)
 
   return app
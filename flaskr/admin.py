@@ -0,0 +1,171 @@
+"""
+Admin endpoints that process sequence files already on the server's disk.
+
+In-house pipelines keep multi-gigabyte sequences on shared storage; instead of
+JSON-encoding and POSTing them, a client names a `source` and a `target` file and
+the server runs `dna_tools.transcribe_file` / `translate_file`, which read the
+source through `mmap` in fixed-size windows and write the result to the target.
+
+The blueprint is only registered when `flaskr.create_app` gets a `data_dir`, and
+every path is resolved inside that directory (symlinks included), so a request
+can never read or write anything else. An existing target is only replaced with
+`"overwrite": true`, and the target can never be the source. Jobs run on the
+request thread rather than the worker pool: they are bounded by disk, not by the
+pool timeout. Each job reserves its source size from the admission work budget
+(`flaskr.admission`), so a few large files cannot starve the API.
+
+These endpoints have no authentication and are not served with CORS headers:
+they are meant for trusted callers only, so expose `/admin` on an internal
+network (or behind an authenticating proxy), never to the public.
+"""
+import os
+from contextlib import contextmanager
+from typing import Iterator
+from flask import Blueprint, Response, jsonify, request
+from pydantic import ValidationError
+from dna import error_types as err
+from dna.dna_tools import transcribe_file, translate_file
+from dto.request_dto import BaseFileReqContent, TranscribeFileReqDto, TranslateFileReqDto
+from flaskr import admission
+from flaskr import metrics
+from flaskr import middleware as mw
+from flaskr import response_type as restype
+
+_data_dir: str | None = None
+
+def configure(data_dir: str | os.PathLike | None) -> None:
+  """Set the directory the file endpoints may read from and write to, `None` disables them."""
+  global _data_dir
+  _data_dir = os.path.realpath(data_dir) if data_dir is not None else None
+
+def resolve(path: str) -> str:
+  """
+  Absolute path of `path` (relative to the data directory).
+  
+  ### Raises:
+    - **PermissionError:**
+      If the file endpoints are disabled or `path` points outside the data directory
+  """
+  if _data_dir is None:
+    raise PermissionError("File processing is disabled")
+  
+  full_path = os.path.realpath(os.path.join(_data_dir, path))
+  if os.path.commonpath([full_path, _data_dir]) != _data_dir or full_path == _data_dir:
+    raise PermissionError(f"Path is outside the data directory: {path}")
+  return full_path
+
+def resolve_pair(content: BaseFileReqContent) -> tuple[str, str]:
+  """
+  Absolute source and target paths of a file job.
+  
+  ### Raises:
+    - **PermissionError:**
+      If either path points outside the data directory
+    - **ValueError:**
+      If source and target are the same file
+  """
+  source, target = resolve(content.source), resolve(content.target)
+  if source == target or (os.path.exists(target) and os.path.samefile(source, target)):
+    raise ValueError("source and target must be different files", 400)
+  return source, target
+
+@contextmanager
+def _admitted(source: str) -> Iterator[None]:
+  """
+  Reserve the size of `source` (bytes, about one per base) from the admission work budget.
+  
+  ### Raises:
+    - **OverloadedError:**
+      If the job does not fit next to the work already in flight
+  """
+  size = os.path.getsize(source)
+  admission.acquire(size)
+  try:
+    yield
+  finally:
+    admission.release(size)
+
+bp = Blueprint("admin", __name__, url_prefix="/admin")
+
+# ! error handlers
+def _error(e: Exception, message: str, status_code: int) -> Response:
+  metrics.count_error(type(e).__name__)
+  error: restype.ErrorResponse = {
+    "error" : message,
+    "status_code" : status_code
+  }
+  return jsonify(error), error["status_code"]
+
+@bp.errorhandler(ValidationError)
+def handle_validation_error(e: ValidationError) -> Response:
+  return _error(e, mw.validation_errors(e), 400)
+
+@bp.errorhandler(ValueError)
+def handle_json_error(e: ValueError) -> Response:
+  return _error(e, e.args[0], e.args[1])
+
+@bp.errorhandler(err.MoleculeStructureError)
+def handle_molecule_error(e: err.MoleculeStructureError) -> Response:
+  return _error(e, e.args[0], 400)
+
+@bp.errorhandler(PermissionError)
+def handle_permission_error(e: PermissionError) -> Response:
+  return _error(e, e.args[0], 403)
+
+@bp.errorhandler(FileExistsError)
+def handle_exists_error(e: FileExistsError) -> Response:
+  return _error(e, "Target file already exists, set overwrite to replace it", 409)
+
+@bp.errorhandler(admission.OverloadedError)
+def handle_overloaded_error(e: admission.OverloadedError) -> Response:
+  response, status_code = _error(e, e.args[0], 503)
+  return response, status_code, { "Retry-After" : str(admission.retry_after) }
+
+@bp.errorhandler(FileNotFoundError)
+def handle_not_found_error(e: FileNotFoundError) -> Response:
+  return _error(e, "File not found", 404)
+
+@bp.errorhandler(OSError)
+def handle_os_error(e: OSError) -> Response:
+  # never echo the absolute path back
+  return _error(e, e.strerror or "File error", 400)
+
+# ! transcribe file
+@bp.route("/files/transcribe", methods=["POST"])
+def transcribe() -> Response:
+  data = mw.safely_get_body(request=request)
+  content = mw.validate_req(TranscribeFileReqDto, data).content
+  source, target = resolve_pair(content)
+  with _admitted(source), metrics.timer("compute"):
+    result = transcribe_file(
+      source=source,
+      target=target,
+      read_from=content.read_from,
+      to=content.to,
+      overwrite=content.overwrite
+    )
+  result["path"] = content.target
+  
+  return jsonify(result), 200
+
+# ! translate file
+@bp.route("/files/translate", methods=["POST"])
+def translate() -> Response:
+  data = mw.safely_get_body(request=request)
+  content = mw.validate_req(TranslateFileReqDto, data).content
+  source, target = resolve_pair(content)
+  with _admitted(source), metrics.timer("compute"):
+    result = translate_file(
+      source=source,
+      target=target,
+      read_from=content.read_from,
+      to=content.to,
+      naming_type=content.naming_type,
+      genetic_code=content.genetic_code,
+      alternative_starts=content.alternative_starts,
+      overwrite=content.overwrite
+    )
+  result["path"] = content.target
+  
+  return jsonify(result), 200
+
@@ -0,0 +1,110 @@
+"""
+Admission control: request body caps and an in-flight work budget.
+
+Every request is checked before its body is read:
+- its body size (`Content-Length`) must fit the cap for its path, otherwise it is
+  rejected with 413;
+- its work, estimated in bases from the body size, is reserved from a shared
+  budget. When the budget is used up the request is shed with 503 and a
+  `Retry-After` header instead of queueing behind the large requests already
+  running, so small requests keep their latency under heavy load.
+
+A per-path cap replaces the global one, so it may also be larger: `/api/fasta`
+reads its upload record by record with bounded memory and accepts files far
+above the JSON endpoints' cap. A body without `Content-Length` (chunked) is
+counted at its path's cap, and no request reserves more work than the global cap,
+as larger bodies are only accepted by such streaming paths. A single request
+larger than the whole budget is still admitted when nothing else is in flight, so
+the largest allowed sequence can always be processed on an idle server.
+
+Both the Flask app (`flaskr.resource`) and the ASGI app use this module; it is
+configured by `flaskr.configure`.
+"""
+import threading
+
+# path -> maximum body bytes, for endpoints whose payload is small by design or streamed
+DEFAULT_BODY_LIMITS = {
+  "/api/codon-to-protein" : 64 * 1024,
+  "/api/codons-to-proteins" : 1024 * 1024,
+  "/api/fasta" : 16 * 1024 * 1024 * 1024
+}
+
+max_body_bytes: int | None = None
+retry_after = 1
+_body_limits: dict[str, int] = dict(DEFAULT_BODY_LIMITS)
+_work_budget = 0
+_in_flight = 0
+_lock = threading.Lock()
+
+class OverloadedError(Exception):
+  """Raised when a request does not fit the remaining work budget"""
+  def __init__(self, message: str = "Server is busy, retry later"):
+    super().__init__(message)
+
+def configure(
+  max_body: int | None = None,
+  body_limits: dict[str, int] | None = None,
+  work_budget: int = 0,
+  retry_after_seconds: int = 1
+  ) -> None:
+  """
+  ### Args:
+    - **max_body:** maximum body bytes of any request, `None` for no limit
+    - **body_limits:** per-path caps replacing `max_body`, merged over `DEFAULT_BODY_LIMITS`
+    - **work_budget:** bases of work that may be in flight at once, `0` disables shedding
+    - **retry_after_seconds:** value of the `Retry-After` header on 503 responses
+  """
+  global max_body_bytes, retry_after, _body_limits, _work_budget
+  max_body_bytes = max_body
+  retry_after = retry_after_seconds
+  _body_limits = { **DEFAULT_BODY_LIMITS, **(body_limits or {}) }
+  _work_budget = work_budget
+
+def body_limit(path: str) -> int | None:
+  """Body cap in bytes for `path`, `None` when unlimited."""
+  return _body_limits.get(path, max_body_bytes)
+
+def largest_body_limit(max_body: int | None, body_limits: dict[str, int] | None = None) -> int | None:
+  """
+  Largest body any path accepts with these `configure` arguments, `None` when unlimited.
+  The WSGI server's own body cap must be at least this.
+  """
+  if max_body is None:
+    return None
+  return max(max_body, *{ **DEFAULT_BODY_LIMITS, **(body_limits or {}) }.values())
+
+def work_size(path: str, content_length: int | None) -> int:
+  """
+  Work estimate in bases: the body size, or the path's cap when the size is unknown,
+  at most `max_body_bytes` (larger bodies are streamed in bounded pieces).
+  """
+  size = content_length if content_length is not None else (body_limit(path) or 0)
+  return size if max_body_bytes is None else min(size, max_body_bytes)
+
+def acquire(size: int) -> None:
+  """
+  Reserve `size` bases of the work budget.
+
+  ### Raises:
+    - **OverloadedError:**
+      If the reservation does not fit next to the work already in flight
+  """
+  global _in_flight
+  if _work_budget <= 0 or size <= 0:
+    return
+  with _lock:
+    if _in_flight and _in_flight + size > _work_budget:
+      raise OverloadedError()
+    _in_flight += size
+
+def release(size: int) -> None:
+  """Give back a reservation made by `acquire`."""
+  global _in_flight
+  if _work_budget <= 0 or size <= 0:
+    return
+  with _lock:
+    _in_flight -= size
+
+def in_flight() -> int:
+  """Bases of work currently reserved."""
+  return _in_flight
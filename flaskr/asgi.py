@@ -0,0 +1,234 @@
+"""
+ASGI entry point serving the same JSON routes and DTOs as the Flask app.
+
+Request bodies are read asynchronously, so slow uploads only hold a coroutine,
+not a server thread. Parsing, validation, `dna_tools` work and serialization run
+on a bounded thread pool (and, above the pool threshold, on the process pool from
+`flaskr.executor`), keeping the event loop free to accept connections.
+
+Run with any ASGI server, e.g.
+```bash
+uvicorn --factory flaskr.asgi:create_asgi_app --port 5000
+```
+The Flask `create_app` is unchanged and still serves WSGI deployments.
+"""
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs
+from pydantic import ValidationError
+from werkzeug.datastructures import MIMEAccept
+from werkzeug.http import parse_accept_header
+from dna.error_types import MoleculeStructureError
+from flaskr import admission, configure, executor, json_provider, metrics
+from flaskr import middleware as mw
+from flaskr import wire
+
+# path -> (processor, accepts the full_sequence switch, metrics endpoint as in flaskr.resource)
+_JSON_ROUTES = {
+  "/api/transcribe" : (mw.process_transcribe_req, True, "transcribe"),
+  "/api/translate" : (mw.process_translate_req, False, "translate"),
+  "/api/dna-to-protein" : (mw.process_dna_to_protein_req, False, "dna_to_protein"),
+  "/api/rna-to-dna" : (mw.process_rna_to_dna_req, True, "rna_to_dna"),
+  "/api/codon-to-protein" : (mw.process_codon_to_protein, False, "codon_to_protein"),
+  "/api/codons-to-proteins" : (mw.process_codons_to_proteins, False, "codons_to_proteins"),
+  "/api/orfs" : (mw.process_find_orfs_req, False, "find_orfs"),
+  "/api/batch" : (mw.process_batch_req, False, "batch")
+}
+_JSON_HEADERS = [(b"content-type", b"application/json"), (b"access-control-allow-origin", b"*")]
+_MSGPACK_HEADERS = [(b"content-type", wire.MIMETYPE.encode()), (b"access-control-allow-origin", b"*")]
+
+def _dumps(data: object) -> bytes:
+  # keys sorted like Flask's jsonify, so both apps send the same bytes
+  return json_provider.dumps(data, default=str, sort_keys=True)
+
+def _retry_after_headers() -> list:
+  return [*_JSON_HEADERS, (b"retry-after", str(admission.retry_after).encode())]
+
+def _error(message: object, status_code: int) -> tuple[int, bytes]:
+  return status_code, _dumps({ "error" : message, "status_code" : status_code })
+
+def _handle_json(
+  processor,
+  body: bytes,
+  include_full_sequence: bool | None,
+  msgpack_body: bool = False,
+  msgpack_response: bool = False
+  ) -> tuple[int, bytes]:
+  """
+  Validate (parsing the raw body in the same pass), process and serialize one request. Runs on the thread pool.
+  MessagePack bodies are decoded first and MessagePack responses are encoded with `flaskr.wire`.
+  """
+  try:
+    if msgpack_body:
+      with metrics.timer("parse"):
+        body = wire.decode(body)
+    if include_full_sequence is None:
+      result = processor(body)
+    else:
+      result = processor(body, include_full_sequence)
+  except ValidationError as e:
+    metrics.count_error(type(e).__name__)
+    return _error(mw.validation_errors(e), 400)
+  except MoleculeStructureError as e:
+    metrics.count_error(type(e).__name__)
+    return _error(e.args[0], 400)
+  except TimeoutError as e:
+    metrics.count_error(type(e).__name__)
+    return _error("Processing timed out", 504)
+  except executor.PoolUnavailableError as e:
+    metrics.count_error(type(e).__name__)
+    return _error(e.args[0], 503)
+  except ValueError as e:
+    # invalid MessagePack body, see flaskr.wire.decode
+    metrics.count_error(type(e).__name__)
+    return _error(e.args[0], e.args[1] if len(e.args) == 2 else 400)
+  
+  with metrics.timer("serialize"):
+    if msgpack_response:
+      return result["status_code"], wire.encode(result["data"])
+    return result["status_code"], _dumps(result["data"])
+
+class _BodyTooLarge(Exception):
+  pass
+
+async def _read_body(receive, limit: int | None = None) -> bytes:
+  chunks, size = [], 0
+  while True:
+    message = await receive()
+    if message["type"] == "http.disconnect":
+      raise ConnectionError("client disconnected")
+    chunk = message.get("body", b"")
+    size += len(chunk)
+    if limit is not None and size > limit:
+      raise _BodyTooLarge()
+    chunks.append(chunk)
+    if not message.get("more_body", False):
+      return b"".join(chunks)
+
+def _preflight_headers(headers: dict[bytes, bytes]) -> list:
+  """CORS preflight answer, allowing any origin and the requested headers like `flask_cors` does for the Flask app."""
+  allowed = [
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-methods", b"GET, POST, OPTIONS")
+  ]
+  requested_headers = headers.get(b"access-control-request-headers")
+  if requested_headers:
+    allowed.append((b"access-control-allow-headers", requested_headers))
+  return allowed
+
+async def _send(send, status: int, body: bytes, headers: list = _JSON_HEADERS) -> None:
+  await send({
+    "type" : "http.response.start",
+    "status" : status,
+    "headers" : [*headers, (b"content-length", str(len(body)).encode())]
+  })
+  await send({ "type" : "http.response.body", "body" : body })
+
+async def _lifespan(receive, send, threads: ThreadPoolExecutor) -> None:
+  while True:
+    message = await receive()
+    if message["type"] == "lifespan.startup":
+      await send({ "type" : "lifespan.startup.complete" })
+    elif message["type"] == "lifespan.shutdown":
+      threads.shutdown(wait=False, cancel_futures=True)
+      executor.shutdown()
+      await send({ "type" : "lifespan.shutdown.complete" })
+      return
+
+async def _serve_json(scope, receive, send, threads: ThreadPoolExecutor, route: tuple) -> None:
+  """Admit, read, process and answer one POST to a JSON route."""
+  path = scope["path"]
+  headers = dict(scope["headers"])
+  content_type = headers.get(b"content-type", b"").split(b";")[0].strip().decode("latin-1")
+  msgpack_body = wire.is_msgpack(content_type)
+  if msgpack_body and not wire.HAS_MSGPACK:
+    return await _send(send, *_error("MessagePack is not supported by this server", 415))
+  if content_type != "application/json" and not msgpack_body:
+    return await _send(send, *_error("Request must be JSON type", 415))
+  # same negotiation as middleware.wants_msgpack, q-values included
+  accept = parse_accept_header(headers.get(b"accept", b"").decode("latin-1"), MIMEAccept)
+  msgpack_response = wire.HAS_MSGPACK and accept.best_match(["application/json", wire.MIMETYPE]) == wire.MIMETYPE
+  
+  # admission control, before the body is read (see flaskr.admission)
+  content_length = headers.get(b"content-length")
+  content_length = int(content_length) if content_length and content_length.isdigit() else None
+  limit = admission.body_limit(path)
+  if limit is not None and content_length is not None and content_length > limit:
+    metrics.count_error("RequestEntityTooLarge")
+    return await _send(send, *_error("Request body is too large", 413))
+  size = admission.work_size(path, content_length)
+  try:
+    admission.acquire(size)
+  except admission.OverloadedError as e:
+    metrics.count_error(type(e).__name__)
+    return await _send(send, *_error(e.args[0], 503), _retry_after_headers())
+  
+  try:
+    try:
+      body = await _read_body(receive, limit)
+    except ConnectionError:
+      return
+    except _BodyTooLarge:
+      metrics.count_error("RequestEntityTooLarge")
+      return await _send(send, *_error("Request body is too large", 413))
+    
+    processor, has_full_sequence, _ = route
+    include_full_sequence = None
+    if has_full_sequence:
+      query = parse_qs(scope.get("query_string", b"").decode())
+      # packed responses leave it out (see flaskr.wire)
+      include_full_sequence = mw.is_truthy(query.get("full_sequence", ["true"])[0]) and not msgpack_response
+    
+    loop = asyncio.get_running_loop()
+    # run in a copy of this request's context, so metrics recorded there keep its endpoint
+    status, payload = await loop.run_in_executor(
+      threads, contextvars.copy_context().run,
+      _handle_json, processor, body, include_full_sequence, msgpack_body, msgpack_response
+    )
+    if status == 200:
+      response_headers = _MSGPACK_HEADERS if msgpack_response else _JSON_HEADERS
+    else:
+      response_headers = _retry_after_headers() if status == 503 else _JSON_HEADERS
+    await _send(send, status, payload, response_headers)
+  finally:
+    admission.release(size)
+
+def create_asgi_app(max_threads: int = 32, **options):
+  """
+  Create the ASGI application. `max_threads` bounds the threads running request
+  work; every other option is passed to `flaskr.configure` (pool, cache, metrics).
+  """
+  configure(**options)
+  threads = ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix="dna-asgi")
+  
+  async def app(scope, receive, send) -> None:
+    if scope["type"] == "lifespan":
+      return await _lifespan(receive, send, threads)
+    if scope["type"] != "http":
+      return
+    
+    path, method = scope["path"], scope["method"]
+    if method == "OPTIONS" and (path in _JSON_ROUTES or path in ("/api/cache", "/metrics")):
+      return await _send(send, 200, b"", _preflight_headers(dict(scope["headers"])))
+    if path == "/" and method == "GET":
+      return await _send(send, 200, b"Hello, World!", [(b"content-type", b"text/plain")])
+    if path == "/api/cache" and method == "GET":
+      return await _send(send, 200, _dumps(mw.result_cache.stats()))
+    if path == "/metrics" and method == "GET" and metrics.enabled:
+      return await _send(send, 200, metrics.render().encode(), [(b"content-type", b"text/plain; version=0.0.4")])
+    
+    route = _JSON_ROUTES.get(path)
+    if route is None:
+      return await _send(send, *_error("Not Found", 404))
+    if method != "POST":
+      return await _send(send, *_error("Method Not Allowed", 405))
+    
+    # label every metric of this request, including those recorded on the thread pool
+    token = metrics.set_endpoint(route[2])
+    try:
+      await _serve_json(scope, receive, send, threads, route)
+    finally:
+      metrics.reset_endpoint(token)
+  
+  return app
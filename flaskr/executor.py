@@ -0,0 +1,174 @@
+"""
+Process-pool execution for CPU-bound `dna_tools` work.
+
+Waitress serves requests on threads, so long translations would otherwise hold
+the GIL and stall every other request. Work whose input is at least `threshold`
+bases is sent to a `ProcessPoolExecutor`; smaller work still runs inline because
+pickling the arguments would cost more than the call itself.
+
+Functions that can split their own work across the pool (an `executor`
+keyword, see `dna.parallel`) go through `run_split`: at `split_threshold` bases
+and above they run in the serving process and hand chunks to the pool instead
+of sending the whole sequence to a single worker.
+
+The pool is disabled (everything runs inline) until `configure` is called with
+a positive `pool_size`, which `flaskr.create_app` does. Workers are started with
+`forkserver` (`spawn` where it is not available), never by forking the threaded
+server, so they cannot inherit a lock held by another request thread.
+
+When a worker dies (e.g. killed on out-of-memory) the pool is broken for every
+pending and future task; it is replaced by a fresh pool and the affected requests
+fail with `PoolUnavailableError` (503) instead of every later request failing.
+"""
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from typing import Callable, Iterator
+from dna import parallel
+
+_pool: ProcessPoolExecutor | None = None
+_pool_size = 0
+_threshold = 100_000
+_timeout: float | None = 30.0
+_split_threshold = parallel.MIN_LENGTH
+_lock = threading.Lock()
+
+class PoolUnavailableError(Exception):
+  """Raised when a worker died while running a task; the pool has been replaced"""
+  def __init__(self, message: str = "Worker process failed, retry later"):
+    super().__init__(message)
+
+def _disable_in_worker() -> None:
+  """Pool initializer: workers must never submit to the (inherited) parent pool."""
+  global _pool, _pool_size
+  _pool, _pool_size = None, 0
+
+def configure(
+  pool_size: int = 0,
+  threshold: int = 100_000,
+  timeout: float | None = 30.0,
+  split_threshold: int = parallel.MIN_LENGTH
+  ) -> None:
+  """
+  (Re)create the worker pool.
+  
+  ### Args:
+    - **pool_size:** number of worker processes, `0` runs everything inline
+    - **threshold:** minimum input length (bases) that is sent to the pool
+    - **timeout:** seconds to wait for a worker result, `None` waits forever
+    - **split_threshold:** minimum input length (bases) that `run_split` splits across the pool
+  """
+  global _pool, _pool_size, _threshold, _timeout, _split_threshold
+  shutdown()
+  if pool_size > 0:
+    parallel.prepare_pool()
+    _pool = _create_pool(pool_size)
+  _pool_size, _threshold, _timeout, _split_threshold = pool_size, threshold, timeout, split_threshold
+
+def _create_pool(pool_size: int) -> ProcessPoolExecutor:
+  method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+  return ProcessPoolExecutor(
+    max_workers=pool_size,
+    mp_context=multiprocessing.get_context(method),
+    initializer=_disable_in_worker
+  )
+
+def shutdown() -> None:
+  """Stop the worker pool, if any, without waiting for pending work."""
+  global _pool, _pool_size
+  if _pool is not None:
+    _pool.shutdown(wait=False, cancel_futures=True)
+  _pool, _pool_size = None, 0
+
+@contextmanager
+def _replacing_broken(pool: ProcessPoolExecutor) -> Iterator[None]:
+  """
+  Turn `BrokenProcessPool` raised while using `pool` into `PoolUnavailableError`,
+  replacing `pool` first (once, however many requests saw it break).
+  """
+  global _pool
+  try:
+    yield
+  except BrokenProcessPool:
+    with _lock:
+      if _pool is pool:
+        pool.shutdown(wait=False, cancel_futures=True)
+        _pool = _create_pool(_pool_size)
+    raise PoolUnavailableError() from None
+
+def _result(future: Future):
+  """Wait for `future`, cancelling it when it does not finish within the timeout."""
+  try:
+    return future.result(timeout=_timeout)
+  except TimeoutError:
+    future.cancel()
+    raise
+
+def run(func: Callable, size: int, /, **kwargs):
+  """
+  Call `func(**kwargs)` in a worker process when `size` reaches the threshold,
+  otherwise call it inline.
+  
+  ### Raises:
+    - **TimeoutError:**
+      If the worker does not finish within the configured timeout
+    - **PoolUnavailableError:**
+      If the worker died
+    - Anything raised by `func`
+  """
+  pool = _pool
+  if pool is None or size < _threshold:
+    return func(**kwargs)
+  with _replacing_broken(pool):
+    return _result(pool.submit(func, **kwargs))
+
+def run_split(func: Callable, size: int, /, **kwargs):
+  """
+  Call `func(executor=<pool>, timeout=<pool timeout>, **kwargs)` in this process when
+  `size` reaches the split threshold, so `func` can spread chunks over the workers;
+  otherwise same as `run`. The split threshold is the only one: `func` splits whenever
+  it gets an executor.
+  
+  ### Raises:
+    - **TimeoutError:**
+      If the chunks do not finish within the configured timeout
+    - **PoolUnavailableError:**
+      If a worker died
+    - Anything raised by `func` or `run`
+  """
+  pool = _pool
+  if pool is None or size < _split_threshold:
+    return run(func, size, **kwargs)
+  with _replacing_broken(pool):
+    return func(executor=pool, timeout=_timeout, **kwargs)
+
+def run_chunked(func: Callable, items: list, size: int) -> list:
+  """
+  Split `items` into one chunk per worker, call `func(chunk)` for every chunk in
+  parallel and concatenate the returned lists in order. Runs `func(items)` inline
+  when `size` (total bases) is below the threshold.
+  
+  ### Raises:
+    - **TimeoutError:**
+      If any chunk does not finish within the configured timeout
+    - **PoolUnavailableError:**
+      If a worker died
+  """
+  pool = _pool
+  if pool is None or size < _threshold or len(items) < 2:
+    return func(items)
+  
+  chunk_size = -(-len(items) // _pool_size)
+  with _replacing_broken(pool):
+    futures = [pool.submit(func, items[i:i+chunk_size]) for i in range(0, len(items), chunk_size)]
+    results = []
+    try:
+      for future in futures:
+        results.extend(_result(future))
+    except (TimeoutError, BrokenProcessPool):
+      for future in futures:
+        future.cancel()
+      raise
+  return results
@@ -0,0 +1,70 @@
+"""
+Fast JSON encoding for the Flask and ASGI apps.
+
+`FastJSONProvider` replaces Flask's default provider (`app.json`), so `jsonify`,
+the streamed responses and the FASTA NDJSON lines all use it.
+With orjson installed it encodes straight to UTF-8 bytes in C, several times
+faster than the stdlib `json` module on large results such as per-residue amino
+acid lists. Without orjson it behaves exactly like Flask's default provider.
+
+Output is equivalent either way: compact, keys sorted (`sort_keys`, also applied
+by `streaming.iter_json` and the ASGI app), and indented in debug mode. orjson writes non-ASCII characters as UTF-8 instead of `\\u`
+escapes, which is the same document for any JSON parser.
+
+Request bodies of the JSON endpoints are parsed by pydantic
+(`model_validate_json`), which does not go through the provider.
+"""
+import json
+from typing import Any, Callable
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+try:
+  import orjson
+except ImportError:
+  orjson = None
+
+HAS_ORJSON = orjson is not None
+
+def dumps(obj: Any, default: Callable[[Any], Any] | None = None, sort_keys: bool = False, indent: bool = False) -> bytes:
+  """Encode `obj` as compact UTF-8 JSON, with orjson when available."""
+  if orjson is None:
+    return json.dumps(
+      obj,
+      default=default,
+      sort_keys=sort_keys,
+      indent=2 if indent else None,
+      separators=None if indent else (",", ":")
+    ).encode()
+  
+  option = orjson.OPT_NON_STR_KEYS
+  if sort_keys:
+    option |= orjson.OPT_SORT_KEYS
+  if indent:
+    option |= orjson.OPT_INDENT_2
+  return orjson.dumps(obj, default=default, option=option)
+
+class FastJSONProvider(DefaultJSONProvider):
+  """
+  Flask JSON provider backed by orjson, falling back to the stdlib per call
+  when orjson is missing or a call passes `json.dumps` options.
+  """
+  def dumps(self, obj: Any, **kwargs: Any) -> str:
+    if orjson is None or kwargs:
+      return super().dumps(obj, **kwargs)
+    return dumps(obj, default=self.default, sort_keys=self.sort_keys).decode()
+  
+  def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+    if orjson is None or kwargs:
+      return super().loads(s, **kwargs)
+    return orjson.loads(s)
+  
+  def response(self, *args: Any, **kwargs: Any) -> Response:
+    if orjson is None:
+      return super().response(*args, **kwargs)
+    
+    obj = self._prepare_response_obj(args, kwargs)
+    indent = (self.compact is None and self._app.debug) or self.compact is False
+    body = dumps(obj, default=self.default, sort_keys=self.sort_keys, indent=indent)
+    # the body is already bytes, skip the str round trip of the default provider
+    return self._app.response_class(body + b"\n", mimetype=self.mimetype)
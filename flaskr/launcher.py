@@ -0,0 +1,251 @@
+"""
+Multi-process launcher: several waitress workers serving one port.
+
+A single waitress process runs every request under one GIL, so CPU-bound
+translation uses one core however large the machine is. `serve` forks `workers`
+processes that accept connections on the same port:
+- on Linux each worker binds its own socket with `SO_REUSEPORT` and the kernel
+  spreads new connections evenly across them;
+- elsewhere the parent binds one socket before forking and every worker accepts
+  from that shared socket.
+
+Before forking, the parent imports `dna`, `dto` and `flaskr`, compiles every
+genetic code table and runs each `dna_tools` operation once (`warm_up`), then
+freezes the garbage collector. The workers share those pages copy-on-write and
+answer their first request without building tables. The app (and its process
+pool, if any) is created in each worker after the fork.
+
+The parent then supervises: a worker that exits is restarted, and `SIGTERM` /
+`SIGINT` stop all workers. POSIX only (`os.fork`); without it `serve` runs a
+single waitress process.
+"""
+import gc
+import importlib
+import logging
+import os
+import select
+import signal
+import socket
+import sys
+import time
+import traceback
+from typing import Callable, NoReturn
+import waitress
+
+logger = logging.getLogger(__name__)
+
+PRELOAD_PACKAGES = ("dna", "dto", "flaskr")
+REUSE_PORT = hasattr(socket, "SO_REUSEPORT") and sys.platform.startswith("linux")
+STARTUP_TIMEOUT = 60.0 # seconds for every worker to be ready
+STOP_TIMEOUT = 10.0 # seconds between SIGTERM and SIGKILL on shutdown
+MIN_UPTIME = 1.0 # a worker that dies sooner is restarted after `RESTART_DELAY`
+RESTART_DELAY = 1.0
+
+class _Shutdown(Exception):
+  """Raised in the parent by the SIGTERM handler."""
+
+def _raise_shutdown(signum, frame) -> NoReturn:
+  raise _Shutdown()
+
+def warm_up() -> None:
+  """
+  Import the packages in `PRELOAD_PACKAGES` and build every lazily created lookup
+  table (genetic codes, NumPy arrays, regexes) by running each operation once.
+  """
+  for package in PRELOAD_PACKAGES:
+    importlib.import_module(package)
+  
+  from dna import dna_tools, numpy_backend
+  from dna.genetic_code import NCBI_TABLES
+  # long enough for the NumPy path, so its per-table arrays are cached as well
+  rna = "AUG" + "GCU" * (numpy_backend.MIN_LENGTH // 3) + "UAA"
+  for table_id in NCBI_TABLES:
+    dna_tools.translate(rna, genetic_code=table_id)
+    dna_tools.translate(rna, genetic_code=table_id, output_format="columnar")
+  dna_tools.transcribe("TACCGAATT")
+  dna_tools.rna_to_dna("AUGGCUUAA", read_from="5", to="3")
+  dna_tools.dna_to_protein("TACCGAATT")
+  dna_tools.codon_to_protein("GCU")
+  dna_tools.codons_to_proteins(["AUG", "GCU"])
+  dna_tools.find_orfs("AUGGCUUAA")
+
+def _listen_socket(host: str, port: int, reuse_port: bool) -> socket.socket:
+  family = socket.AF_INET6 if ":" in host else socket.AF_INET
+  sock = socket.socket(family, socket.SOCK_STREAM)
+  try:
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if reuse_port:
+      sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+  except OSError:
+    sock.close()
+    raise
+  return sock
+
+def _run_worker(
+  index: int,
+  app_factory: Callable,
+  address: tuple[str, int],
+  shared_socket: socket.socket | None,
+  ready_fd: int | None,
+  parent_fd: int | None,
+  options: dict
+  ) -> NoReturn:
+  """
+  Body of a forked worker: bind (unless sharing the parent's socket), build the app
+  and serve. Never returns, so no exception can leak into the parent's code.
+  """
+  status = 1
+  try:
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    if parent_fd is not None:
+      os.close(parent_fd)
+    sock = shared_socket or _listen_socket(*address, reuse_port=True)
+    sock.listen(options.get("backlog", 1024))
+    app = app_factory()
+    if ready_fd is not None:
+      os.write(ready_fd, b"\x01")
+      os.close(ready_fd)
+    logger.info("Worker %d (pid %d) ready", index, os.getpid())
+    waitress.serve(app, sockets=[sock], **options)
+    status = 0
+  except BaseException:
+    traceback.print_exc()
+  finally:
+    # skip the parent's atexit handlers and buffered state inherited through fork
+    os._exit(status)
+
+def _wait_ready(read_fd: int, workers: int, children: dict[int, tuple[int, float]]) -> None:
+  """
+  Wait until every worker has signalled on the ready pipe.
+  
+  ### Raises:
+    - **RuntimeError:**
+      If a worker exits or the workers are not ready within `STARTUP_TIMEOUT`
+  """
+  ready = 0
+  deadline = time.monotonic() + STARTUP_TIMEOUT
+  while ready < workers:
+    if time.monotonic() > deadline:
+      raise RuntimeError(f"Only {ready} of {workers} workers started within {STARTUP_TIMEOUT:.0f}s")
+    readable, _, _ = select.select([read_fd], [], [], 0.5)
+    if readable:
+      ready += len(os.read(read_fd, workers - ready))
+    pid, status = os.waitpid(-1, os.WNOHANG)
+    if pid:
+      children.pop(pid, None)
+      raise RuntimeError(f"Worker (pid {pid}) exited during startup with status {os.waitstatus_to_exitcode(status)}")
+
+def _stop(children: dict[int, tuple[int, float]]) -> None:
+  """SIGTERM every worker, then SIGKILL the ones still running after `STOP_TIMEOUT`."""
+  for pid in children:
+    try:
+      os.kill(pid, signal.SIGTERM)
+    except ProcessLookupError:
+      pass
+  
+  deadline = time.monotonic() + STOP_TIMEOUT
+  while children and time.monotonic() < deadline:
+    try:
+      pid, _ = os.waitpid(-1, os.WNOHANG)
+    except ChildProcessError:
+      break
+    if pid:
+      children.pop(pid, None)
+    else:
+      time.sleep(0.05)
+  
+  for pid in children:
+    try:
+      os.kill(pid, signal.SIGKILL)
+      os.waitpid(pid, 0)
+    except (ProcessLookupError, ChildProcessError):
+      pass
+  children.clear()
+
+def serve(
+  app_factory: Callable,
+  host: str = "0.0.0.0",
+  port: int = 5000,
+  workers: int | None = None,
+  started: float | None = None,
+  **options
+  ) -> None:
+  """
+  Serve `app_factory()` with `workers` waitress processes until SIGTERM or SIGINT.
+  
+  ### Args:
+    - **app_factory:** called once in every worker to create the WSGI app
+    - **host, port:** address to listen on, port `0` picks a free port
+    - **workers:** number of worker processes, `None` uses one per CPU core
+    - **started:** `time.perf_counter()` at process start, for the startup time report
+    - **options:** passed to `waitress.serve` in every worker (`threads`, `backlog`, ...)
+  
+  ### Raises:
+    - **OSError:**
+      If the address cannot be bound
+    - **RuntimeError:**
+      If a worker fails to start
+  """
+  started = time.perf_counter() if started is None else started
+  workers = workers or os.cpu_count() or 1
+  if not hasattr(os, "fork"):
+    waitress.serve(app_factory(), host=host, port=port, **options)
+    return
+  
+  warm_up()
+  warmed = time.perf_counter()
+  
+  # with SO_REUSEPORT the parent only holds the port (bound, never listening) so it
+  # fails early when the port is taken and port 0 resolves once for every worker
+  parent_socket = _listen_socket(host, port, reuse_port=REUSE_PORT)
+  address = parent_socket.getsockname()[:2]
+  shared_socket = None if REUSE_PORT else parent_socket
+  
+  children: dict[int, tuple[int, float]] = {} # pid -> (worker index, start time)
+  read_fd, write_fd = os.pipe()
+  gc.collect()
+  gc.freeze() # keep the preloaded objects out of GC passes so their pages stay shared
+  
+  def spawn(index: int, starting: bool) -> None:
+    # only the first workers report on the ready pipe, restarted ones are not waited for
+    ready_fd, parent_fd = (write_fd, read_fd) if starting else (None, None)
+    pid = os.fork()
+    if pid == 0:
+      _run_worker(index, app_factory, address, shared_socket, ready_fd, parent_fd, options)
+    children[pid] = (index, time.monotonic())
+  
+  previous_handler = signal.signal(signal.SIGTERM, _raise_shutdown)
+  try:
+    for index in range(workers):
+      spawn(index, True)
+    os.close(write_fd)
+    _wait_ready(read_fd, workers, children)
+    os.close(read_fd)
+    if REUSE_PORT:
+      parent_socket.close()
+    logger.info(
+      "%d workers (%s) serving on http://%s:%d, startup %.0f ms (import and warm-up %.0f ms)",
+      workers, "SO_REUSEPORT" if REUSE_PORT else "shared socket", *address,
+      (time.perf_counter() - started) * 1e3, (warmed - started) * 1e3
+    )
+    
+    while True:
+      pid, status = os.wait()
+      if pid not in children:
+        continue
+      index, spawned = children.pop(pid)
+      logger.warning(
+        "Worker %d (pid %d) exited with status %d, restarting",
+        index, pid, os.waitstatus_to_exitcode(status)
+      )
+      if time.monotonic() - spawned < MIN_UPTIME:
+        time.sleep(RESTART_DELAY)
+      spawn(index, False)
+  except (_Shutdown, KeyboardInterrupt):
+    logger.info("Stopping %d workers", len(children))
+  finally:
+    signal.signal(signal.SIGTERM, previous_handler)
+    _stop(children)
+    parent_socket.close()
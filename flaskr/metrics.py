@@ -0,0 +1,159 @@
+"""
+Lightweight request metrics in the Prometheus text exposition format.
+
+Per endpoint it records stage timings (`parse`, `validate`, `compute`,
+`serialize`), processed sequence lengths and error counts. Everything is a no-op
+until `configure(enabled=True)` is called (see `flaskr.create_app`): `timer`
+then hands out one shared `nullcontext` and the observe functions return
+immediately.
+
+Only work done in the serving process is recorded; for jobs sent to the process
+pool, `compute` covers the whole round trip to the worker.
+"""
+import threading
+import time
+from bisect import bisect_left
+from contextlib import nullcontext
+from contextvars import ContextVar, Token
+from flask import Blueprint, Response, has_request_context, request
+
+_DURATION_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+_LENGTH_BUCKETS = (10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000)
+_NULL_TIMER = nullcontext()
+
+enabled = False
+_lock = threading.Lock()
+# endpoint of the current request outside Flask (the ASGI app), see `set_endpoint`
+_current_endpoint: ContextVar[str | None] = ContextVar("metrics_endpoint", default=None)
+
+class Histogram:
+  """Cumulative histogram with one series per label tuple."""
+  def __init__(self, name: str, help_text: str, label_names: tuple[str, ...], buckets: tuple[float, ...]):
+    self.name = name
+    self.help_text = help_text
+    self.label_names = label_names
+    self.buckets = buckets
+    self._series: dict[tuple[str, ...], list] = {}
+  
+  def observe(self, labels: tuple[str, ...], value: float) -> None:
+    series = self._series.get(labels)
+    if series is None:
+      # bucket counts (+Inf last), sum
+      series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+    series[0][bisect_left(self.buckets, value)] += 1
+    series[1] += value
+  
+  def clear(self) -> None:
+    self._series.clear()
+  
+  def render(self) -> list[str]:
+    lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+    for labels, (counts, total) in sorted(self._series.items()):
+      label_text = _labels(self.label_names, labels)
+      cumulative = 0
+      for bound, count in zip((*self.buckets, "+Inf"), counts):
+        cumulative += count
+        lines.append(f'{self.name}_bucket{{{label_text},le="{bound}"}} {cumulative}')
+      lines.append(f"{self.name}_sum{{{label_text}}} {total}")
+      lines.append(f"{self.name}_count{{{label_text}}} {cumulative}")
+    return lines
+
+class Counter:
+  """Monotonic counter with one series per label tuple."""
+  def __init__(self, name: str, help_text: str, label_names: tuple[str, ...]):
+    self.name = name
+    self.help_text = help_text
+    self.label_names = label_names
+    self._series: dict[tuple[str, ...], int] = {}
+  
+  def inc(self, labels: tuple[str, ...]) -> None:
+    self._series[labels] = self._series.get(labels, 0) + 1
+  
+  def clear(self) -> None:
+    self._series.clear()
+  
+  def render(self) -> list[str]:
+    lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+    for labels, value in sorted(self._series.items()):
+      lines.append(f"{self.name}{{{_labels(self.label_names, labels)}}} {value}")
+    return lines
+
+def _labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+  escaped = (value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for value in values)
+  return ",".join(f'{name}="{value}"' for name, value in zip(names, escaped))
+
+stage_seconds = Histogram(
+  "dna_api_stage_seconds", "Time spent per request stage.",
+  ("endpoint", "stage"), _DURATION_BUCKETS
+)
+sequence_length = Histogram(
+  "dna_api_sequence_length_bases", "Length of processed sequences.",
+  ("endpoint",), _LENGTH_BUCKETS
+)
+errors = Counter(
+  "dna_api_errors_total", "Errors returned, by endpoint and error type.",
+  ("endpoint", "error")
+)
+_METRICS = (stage_seconds, sequence_length, errors)
+
+def configure(enable: bool) -> None:
+  global enabled
+  enabled = enable
+
+def reset() -> None:
+  """Drop every recorded series."""
+  with _lock:
+    for metric in _METRICS:
+      metric.clear()
+
+def set_endpoint(endpoint: str) -> Token:
+  """Label the metrics recorded in the current context with `endpoint`, where there is no Flask request."""
+  return _current_endpoint.set(endpoint)
+
+def reset_endpoint(token: Token) -> None:
+  """Undo a `set_endpoint`."""
+  _current_endpoint.reset(token)
+
+def _endpoint() -> str:
+  if has_request_context() and request.endpoint:
+    return request.endpoint.rpartition(".")[2]
+  return _current_endpoint.get() or "none"
+
+class _StageTimer:
+  __slots__ = ("stage", "start")
+  
+  def __init__(self, stage: str):
+    self.stage = stage
+  
+  def __enter__(self):
+    self.start = time.perf_counter()
+  
+  def __exit__(self, *exc_info):
+    elapsed = time.perf_counter() - self.start
+    with _lock:
+      stage_seconds.observe((_endpoint(), self.stage), elapsed)
+
+def timer(stage: str):
+  """Context manager that records how long the enclosed `stage` took."""
+  return _StageTimer(stage) if enabled else _NULL_TIMER
+
+def observe_length(length: int) -> None:
+  if enabled:
+    with _lock:
+      sequence_length.observe((_endpoint(),), length)
+
+def count_error(error: str) -> None:
+  if enabled:
+    with _lock:
+      errors.inc((_endpoint(), error))
+
+def render() -> str:
+  """All metrics in the Prometheus text exposition format."""
+  with _lock:
+    return "\n".join(line for metric in _METRICS for line in metric.render()) + "\n"
+
+bp = Blueprint("metrics", __name__)
+
+@bp.route("/metrics", methods=["GET"])
+def metrics() -> Response:
+  return Response(render(), mimetype="text/plain; version=0.0.4")
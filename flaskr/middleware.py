@@ -1,44 +1,146 @@
+import gzip
+import json
+import zlib
+from typing import BinaryIO, Callable, Iterator
 from flask import Request
+from pydantic import BaseModel, ValidationError
 from dto.request_dto import (
   TranscribeReqDto,
   TranslateReqDto,
   RnaToDnaReqDto,
-  CodonToProteinReqDto
+  CodonToProteinReqDto,
+  CodonsToProteinsReqDto,
+  FindOrfsReqDto,
+  DnaToProteinReqDto,
+  BatchReqDto,
+  FastaReqParams,
+  MAX_SEQUENCE_LENGTH
 )
-from flaskr.response_type import SuccessResponse
+from flaskr import executor
+from flaskr import metrics
+from flaskr import wire
+from flaskr.response_type import (
+  SuccessResponse,
+  ErrorResponse,
+  RecordSuccessResponse,
+  RecordErrorResponse
+)
+from dna.cache import ResultCache, make_key
+from dna.error_enum import ErrorMessage
+from dna.error_types import MoleculeStructureError
+from dna.fasta import read_records
 from dna.dna_tools import (
   transcribe, 
   translate, 
   rna_to_dna, 
-  codon_to_protein
+  codon_to_protein,
+  codons_to_proteins,
+  find_orfs,
+  dna_to_protein
 )
 
-# ! get json
-def safely_get_json(request: Request):
+# ! get body
+def safely_get_body(request: Request) -> bytes | dict:
   """
-  Safely get json form request.
+  Get the raw JSON body of the request, to be parsed and validated in one step by
+  `validate_req`. A MessagePack body (see `flaskr.wire`) is decoded here instead,
+  with packed sequences unpacked into strings.
   
   ### Returns:
   ```
-  json_data: any
+  body: bytes | dict
   ```
   
   ### Raises:
     - **ValueError:**
-      If the request is not JSON or has an invalid JSON format
+      If the request is neither JSON nor MessagePack, or the MessagePack body is invalid
   """
+  if wire.is_msgpack(request.mimetype):
+    if not wire.HAS_MSGPACK:
+      raise ValueError("MessagePack is not supported by this server", 415)
+    with metrics.timer("parse"):
+      return wire.decode(request.get_data(cache=False))
+  
   if not request.is_json:
-    raise ValueError("Request must be JSON type", status_code=415)
+    raise ValueError("Request must be JSON type", 415)
   
-  json_data = request.get_json(silent=True)
-  if json_data is None:
-    raise ValueError("Invalid JSON format", status_code=400)
+  with metrics.timer("parse"):
+    return request.get_data(cache=False)
+
+# ! validate
+def validate_req(dto: type[BaseModel], req_data: dict | bytes | str) -> BaseModel:
+  """
+  Validate a request against `dto`. Raw JSON (`bytes`/`str`) goes through
+  `model_validate_json`, which parses and validates in one pass without building
+  an intermediate dict; already parsed data (e.g. batch items) uses `model_validate`.
   
-  return json_data
+  ### Raises:
+  - ValidationError
+  """
+  with metrics.timer("validate"):
+    if isinstance(req_data, (bytes, str)):
+      return dto.model_validate_json(req_data)
+    return dto.model_validate(req_data)
+
+def validation_errors(e: ValidationError) -> list[dict]:
+  """
+  JSON-safe error details of a ValidationError. The offending input is left out, so a
+  rejected multi-megabase sequence is not echoed back in the error response.
+  """
+  return json.loads(e.json(include_input=False))
+
+# ! response options
+_TRUTHY = {"1", "true", "yes", "on"}
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+def is_truthy(value: str) -> bool:
+  """Whether a query parameter value means "on" (`1`, `true`, `yes`, `on`)."""
+  return value.lower() in _TRUTHY
+
+def wants_ndjson(request: Request) -> bool:
+  """Whether the client prefers `application/x-ndjson` over `application/json`."""
+  return request.accept_mimetypes.best_match(["application/json", NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+
+def wants_msgpack(request: Request) -> bool:
+  """Whether the client prefers MessagePack (`Accept: application/msgpack`) and it is available."""
+  return wire.HAS_MSGPACK and request.accept_mimetypes.best_match(["application/json", wire.MIMETYPE]) == wire.MIMETYPE
+
+def wants_stream(request: Request) -> bool:
+  """
+  Whether the client opted in to a streamed response, either with `?stream=true`
+  or with an `Accept: application/x-ndjson` header.
+  """
+  return is_truthy(request.args.get("stream", "")) or wants_ndjson(request)
+
+def wants_full_sequence(request: Request) -> bool:
+  """
+  Whether `full_sequence` should be included, turned off with `?full_sequence=false`.
+  MessagePack responses never carry it (see `flaskr.wire`), so it is not built for them.
+  """
+  return is_truthy(request.args.get("full_sequence", "true")) and not wants_msgpack(request)
+
+# ! run operation
+result_cache = ResultCache()
+_SPLIT_OPERATIONS = {transcribe, rna_to_dna}
+
+def run_operation(func: Callable, sequence_arg: str, /, **kwargs):
+  """
+  Run a <code>dna_tools</code> function through the result cache. On a miss the function runs via
+  <code>executor.run</code>, so repeated identical requests skip validation and computation.
+  <code>sequence_arg</code> is the name of the sequence argument (<code>dna</code> or <code>rna</code>).
+  Transcribe and RNA-to-DNA split very long sequences across the pool (<code>executor.run_split</code>).
+  """
+  sequence = kwargs[sequence_arg]
+  params = { key: val for key, val in kwargs.items() if key != sequence_arg }
+  run = executor.run_split if func in _SPLIT_OPERATIONS else executor.run
+  metrics.observe_length(len(sequence))
+  with metrics.timer("compute"):
+    key = make_key(func.__name__, sequence, **params)
+    return result_cache.get_or_compute(key, lambda: run(func, len(sequence), **kwargs))
 
 # ! process request
 # ! transcribe
-def process_transcribe_req(req_data: dict) -> SuccessResponse:
+def process_transcribe_req(req_data: dict | bytes, include_full_sequence: bool = True) -> SuccessResponse:
   """
   Memproses permintaan transkripsi DNA ke RNA.
   
@@ -50,12 +152,15 @@ def process_transcribe_req(req_data: dict) -> SuccessResponse:
   - InvalidStrandReadError
   - InvalidDnaError
   """
-  validated_data = TranscribeReqDto.model_validate(req_data)
+  validated_data = validate_req(TranscribeReqDto, req_data)
   content = validated_data.content
-  result = transcribe(
+  result = run_operation(
+    transcribe,
+    "dna",
     dna=content.sequence,
     read_from=content.read_from,
-    to=content.to
+    to=content.to,
+    include_full_sequence=include_full_sequence
   )
   
   return {
@@ -64,7 +169,7 @@ def process_transcribe_req(req_data: dict) -> SuccessResponse:
   }
 
 # ! translate
-def process_translate_req(req_data: dict) -> SuccessResponse:
+def process_translate_req(req_data: dict | bytes) -> SuccessResponse:
   """
   Memproses permintaan translasi RNA ke protein.
   
@@ -77,13 +182,50 @@ def process_translate_req(req_data: dict) -> SuccessResponse:
   - InvalidDnaError
   - NoStartCodonError
   """
-  validated_data = TranslateReqDto.model_validate(req_data)
+  validated_data = validate_req(TranslateReqDto, req_data)
   content = validated_data.content
-  result = translate(
+  result = run_operation(
+    translate,
+    "rna",
     rna=content.sequence,
     naming_type=content.naming_type,
     read_from=content.read_from,
-    to=content.to
+    to=content.to,
+    genetic_code=content.genetic_code,
+    alternative_starts=content.alternative_starts,
+    output_format=content.output_format
+  )
+  
+  return {
+    "data" : result,
+    "status_code" : 200
+  }
+
+# ! DNA to protein
+def process_dna_to_protein_req(req_data: dict | bytes) -> SuccessResponse:
+  """
+  Memproses permintaan transkripsi dan translasi DNA sekaligus, tanpa membuat RNA utuh.
+  
+  ### Returns:
+  SuccessResponse
+
+  ### Raises:
+  - ValidationError
+  - InvalidStrandReadError
+  - InvalidDnaError
+  - NoStartCodonError
+  """
+  validated_data = validate_req(DnaToProteinReqDto, req_data)
+  content = validated_data.content
+  result = run_operation(
+    dna_to_protein,
+    "dna",
+    dna=content.sequence,
+    naming_type=content.naming_type,
+    read_from=content.read_from,
+    to=content.to,
+    genetic_code=content.genetic_code,
+    alternative_starts=content.alternative_starts
   )
   
   return {
@@ -92,7 +234,7 @@ def process_translate_req(req_data: dict) -> SuccessResponse:
   }
 
 # ! RNA to DNA
-def process_rna_to_dna_req(req_data: dict) -> SuccessResponse:
+def process_rna_to_dna_req(req_data: dict | bytes, include_full_sequence: bool = True) -> SuccessResponse:
   """
   Memproses permintaan konversi RNA ke DNA
   
@@ -104,12 +246,15 @@ def process_rna_to_dna_req(req_data: dict) -> SuccessResponse:
   - InvalidStrandReadError
   - InvalidRnaError
   """
-  validated_data = RnaToDnaReqDto.model_validate(req_data)
+  validated_data = validate_req(RnaToDnaReqDto, req_data)
   content = validated_data.content
-  result = rna_to_dna(
+  result = run_operation(
+    rna_to_dna,
+    "rna",
     rna=content.sequence,
     read_from=content.read_from,
-    to=content.to
+    to=content.to,
+    include_full_sequence=include_full_sequence
   )
   
   return {
@@ -118,7 +263,7 @@ def process_rna_to_dna_req(req_data: dict) -> SuccessResponse:
   }
 
 # ! codon to protein
-def process_codon_to_protein(req_data: dict) -> SuccessResponse:
+def process_codon_to_protein(req_data: dict | bytes) -> SuccessResponse:
   """
   Memproses permintaan konversi kodon ke asam amino
   
@@ -129,14 +274,230 @@ def process_codon_to_protein(req_data: dict) -> SuccessResponse:
   - ValidationError
   - InvalidCodonError
   """
-  validated_data = CodonToProteinReqDto.model_validate(req_data)
+  validated_data = validate_req(CodonToProteinReqDto, req_data)
   content = validated_data.content
-  result = codon_to_protein(
-    codon=content.codon,
-    naming_type=content.naming_type
+  with metrics.timer("compute"):
+    result = codon_to_protein(
+      codon=content.codon,
+      naming_type=content.naming_type
+    )
+  
+  return {
+    "data" : result,
+    "status_code" : 200
+  }
+
+# ! codons to proteins
+def process_codons_to_proteins(req_data: dict | bytes) -> SuccessResponse:
+  """
+  Memproses permintaan konversi banyak kodon ke asam amino sekaligus
+  
+  ### Returns:
+  SuccessResponse
+
+  ### Raises:
+  - ValidationError
+  - InvalidCodonError
+  """
+  validated_data = validate_req(CodonsToProteinsReqDto, req_data)
+  content = validated_data.content
+  with metrics.timer("compute"):
+    result = codons_to_proteins(
+      codons=content.codons,
+      naming_type=content.naming_type
+    )
+  
+  return {
+    "data" : result,
+    "status_code" : 200
+  }
+
+# ! find ORFs
+def process_find_orfs_req(req_data: dict | bytes) -> SuccessResponse:
+  """
+  Memproses permintaan pencarian ORF pada keenam reading frame RNA.
+  
+  ### Returns:
+  SuccessResponse
+
+  ### Raises:
+  - ValidationError
+  - InvalidStrandReadError
+  - InvalidRnaError
+  """
+  validated_data = validate_req(FindOrfsReqDto, req_data)
+  content = validated_data.content
+  result = run_operation(
+    find_orfs,
+    "rna",
+    rna=content.sequence,
+    naming_type=content.naming_type,
+    read_from=content.read_from,
+    to=content.to,
+    min_length=content.min_length
   )
   
   return {
     "data" : result,
     "status_code" : 200
   }
+
+# ! batch
+_BATCH_PROCESSORS = {
+  "transcribe" : process_transcribe_req,
+  "translate" : process_translate_req,
+  "rna-to-dna" : process_rna_to_dna_req,
+  "codon-to-protein" : process_codon_to_protein,
+  "codons-to-proteins" : process_codons_to_proteins,
+  "orfs" : process_find_orfs_req,
+  "dna-to-protein" : process_dna_to_protein_req
+}
+
+def process_batch_item(item: object) -> SuccessResponse | ErrorResponse:
+  """
+  Memproses satu operasi di dalam batch berdasarkan <code>action</code>-nya. Error tidak
+  dilempar, melainkan dikembalikan sebagai ErrorResponse untuk item tersebut.
+  
+  ### Returns:
+  SuccessResponse | ErrorResponse
+  """
+  if not isinstance(item, dict):
+    return {
+      "error" : "Operation must be an object",
+      "status_code" : 400
+    }
+  
+  action = item.get("action")
+  processor = _BATCH_PROCESSORS.get(action) if isinstance(action, str) else None
+  if processor is None:
+    return {
+      "error" : f"Unknown action: {action}",
+      "status_code" : 400
+    }
+  
+  try:
+    return processor(item)
+  except ValidationError as e:
+    metrics.count_error(type(e).__name__)
+    return {
+      "error" : validation_errors(e),
+      "status_code" : 400
+    }
+  except MoleculeStructureError as e:
+    metrics.count_error(type(e).__name__)
+    return {
+      "error" : e.args[0],
+      "status_code" : e.status_code
+    }
+
+def process_batch_items(items: list) -> list[SuccessResponse | ErrorResponse]:
+  """
+  Memproses sekumpulan operasi batch secara berurutan.
+  
+  ### Returns:
+  list[SuccessResponse | ErrorResponse]
+  """
+  return [process_batch_item(item) for item in items]
+
+def _batch_item_size(item: object) -> int:
+  """Panjang <code>sequence</code> (atau <code>codon</code>) sebuah operasi batch, 0 jika tidak ada."""
+  content = item.get("content") if isinstance(item, dict) else None
+  if not isinstance(content, dict):
+    return 0
+  sequence = content.get("sequence", content.get("codon"))
+  return len(sequence) if isinstance(sequence, str) else 0
+
+def process_batch_req(req_data: dict | bytes) -> SuccessResponse:
+  """
+  Memproses banyak operasi (transcribe, translate, rna-to-dna, codon-to-protein) dalam satu
+  permintaan. Hasil dikembalikan per item dengan urutan yang sama seperti <code>operations</code>.
+  Batch yang besar dibagi ke worker process (lihat <code>flaskr.executor</code>).
+  
+  ### Returns:
+  SuccessResponse
+  
+  ### Raises:
+  - ValidationError
+  - TimeoutError
+  """
+  validated_data = validate_req(BatchReqDto, req_data)
+  operations = validated_data.operations
+  size = sum(_batch_item_size(item) for item in operations)
+  results = executor.run_chunked(process_batch_items, operations, size)
+  
+  return {
+    "data" : results,
+    "status_code" : 200
+  }
+
+# ! FASTA/FASTQ upload
+_FASTA_MIMETYPES = {"text/x-fasta", "text/x-fastq", "text/plain"}
+_GZIP_MIMETYPES = {"application/gzip", "application/x-gzip"}
+_FASTA_OPERATIONS = {
+  "transcribe" : (transcribe, "dna"),
+  "translate" : (translate, "rna")
+}
+
+def safely_get_sequence_stream(request: Request) -> BinaryIO:
+  """
+  Get the (decompressed) body stream of a FASTA/FASTQ upload without buffering it.
+  
+  ### Returns:
+  ```
+  stream: BinaryIO
+  ```
+  
+  ### Raises:
+    - **ValueError:**
+      If the request is not a (gzipped) FASTA/FASTQ body
+  """
+  is_gzip = request.mimetype in _GZIP_MIMETYPES or request.content_encoding == "gzip"
+  if not is_gzip and request.mimetype not in _FASTA_MIMETYPES:
+    raise ValueError("Request must be text/x-fasta, text/x-fastq or gzipped", 415)
+  
+  return gzip.GzipFile(fileobj=request.stream) if is_gzip else request.stream
+
+def _process_records(
+  stream: BinaryIO,
+  params: FastaReqParams
+  ) -> Iterator[RecordSuccessResponse | RecordErrorResponse]:
+  operation, sequence_arg = _FASTA_OPERATIONS[params.action]
+  kwargs = params.model_dump(exclude={"action", "full_sequence"}, exclude_none=True)
+  if params.action == "transcribe":
+    for key in ("naming_type", "genetic_code", "alternative_starts", "output_format"):
+      kwargs.pop(key, None)
+    kwargs["include_full_sequence"] = params.full_sequence
+  
+  try:
+    for header, sequence in read_records(stream, MAX_SEQUENCE_LENGTH):
+      if sequence is None:
+        message = f"{ErrorMessage.RECORD_TOO_LONG.value}: more than {MAX_SEQUENCE_LENGTH} bases"
+        yield { "id" : header, "error" : message, "status_code" : 400 }
+        continue
+      try:
+        kwargs[sequence_arg] = sequence
+        data = run_operation(operation, sequence_arg, **kwargs)
+        yield { "id" : header, "data" : data, "status_code" : 200 }
+      except MoleculeStructureError as e:
+        yield { "id" : header, "error" : e.args[0], "status_code" : e.status_code }
+  except (MoleculeStructureError, OSError, EOFError, zlib.error) as e:
+    # the stream itself is broken (bad format, corrupt gzip): report it and stop
+    status_code = getattr(e, "status_code", 400)
+    yield { "id" : None, "error" : str(e.args[0]) if e.args else str(e), "status_code" : status_code }
+
+def process_fasta_req(
+  stream: BinaryIO,
+  req_params: dict
+  ) -> Iterator[RecordSuccessResponse | RecordErrorResponse]:
+  """
+  Memproses unggahan FASTA/FASTQ record demi record. Parameter divalidasi sebelum stream dibaca,
+  sedangkan error per record (atau stream yang rusak) dikembalikan sebagai item error.
+  
+  ### Returns:
+  Iterator[RecordSuccessResponse | RecordErrorResponse]
+
+  ### Raises:
+  - ValidationError
+  """
+  params = validate_req(FastaReqParams, req_params)
+  return _process_records(stream, params)
@@ -1,25 +1,57 @@
+from itertools import chain
 from flask import (
-  Blueprint, request, jsonify, Response
+  Blueprint, request, jsonify, Response, current_app, g, stream_with_context
 )
 from pydantic import ValidationError
+from werkzeug.exceptions import RequestEntityTooLarge
 from dna import error_types as err
 from dto.request_dto import *
+from flaskr import admission
+from flaskr import executor
+from flaskr import json_provider
 from flaskr import middleware as mw
+from flaskr import metrics
 from flaskr import response_type as restype
+from flaskr import wire
+from flaskr.streaming import iter_json
 
 bp = Blueprint("resource", __name__, url_prefix="/api")
 
+# ! admission control
+@bp.before_request
+def admit() -> None:
+  """Reject oversized bodies (413) and shed load (503) before the body is read."""
+  if request.method == "GET":
+    return
+  
+  limit = admission.body_limit(request.path)
+  if limit is not None:
+    if request.content_length is not None and request.content_length > limit:
+      raise RequestEntityTooLarge()
+    # also stops chunked bodies without Content-Length once they pass the cap
+    request.max_content_length = limit
+  
+  size = admission.work_size(request.path, request.content_length)
+  admission.acquire(size)
+  g.admitted_size = size
+
+@bp.teardown_request
+def release(_exc: BaseException | None) -> None:
+  admission.release(g.pop("admitted_size", 0))
+
 # ! error handlers
 @bp.errorhandler(ValidationError)
 def handle_validation_error(e: ValidationError) -> Response:
+  metrics.count_error(type(e).__name__)
   error: restype.ErrorResponse = {
-    "error" : e.errors(),
+    "error" : mw.validation_errors(e),
     "status_code" : 400
   }
   return jsonify(error), error["status_code"]
 
 @bp.errorhandler(ValueError)
 def handle_json_error(e: ValueError) -> Response:
+  metrics.count_error(type(e).__name__)
   error: restype.ErrorResponse = {
     "error" : e.args[0],
     "status_code" : e.args[1]
@@ -28,40 +60,149 @@ def handle_json_error(e: ValueError) -> Response:
 
 @bp.errorhandler(err.MoleculeStructureError)
 def handle_json_error(e: err.MoleculeStructureError) -> Response:
+  metrics.count_error(type(e).__name__)
   error: restype.ErrorResponse = {
     "error" : e.args[0],
     "status_code" : 400
   }
   return jsonify(error), error["status_code"]
 
+@bp.errorhandler(RequestEntityTooLarge)
+def handle_too_large_error(e: RequestEntityTooLarge) -> Response:
+  metrics.count_error(type(e).__name__)
+  error: restype.ErrorResponse = {
+    "error" : "Request body is too large",
+    "status_code" : 413
+  }
+  return jsonify(error), error["status_code"]
+
+@bp.errorhandler(admission.OverloadedError)
+def handle_overloaded_error(e: admission.OverloadedError) -> Response:
+  metrics.count_error(type(e).__name__)
+  error: restype.ErrorResponse = {
+    "error" : e.args[0],
+    "status_code" : 503
+  }
+  return jsonify(error), error["status_code"], { "Retry-After" : str(admission.retry_after) }
+
+@bp.errorhandler(executor.PoolUnavailableError)
+def handle_pool_unavailable_error(e: executor.PoolUnavailableError) -> Response:
+  metrics.count_error(type(e).__name__)
+  error: restype.ErrorResponse = {
+    "error" : e.args[0],
+    "status_code" : 503
+  }
+  return jsonify(error), error["status_code"], { "Retry-After" : str(admission.retry_after) }
+
+@bp.errorhandler(TimeoutError)
+def handle_timeout_error(e: TimeoutError) -> Response:
+  metrics.count_error(type(e).__name__)
+  error: restype.ErrorResponse = {
+    "error" : "Processing timed out",
+    "status_code" : 504
+  }
+  return jsonify(error), error["status_code"]
+
+# ! response
+def send_result(result: restype.SuccessResponse) -> Response:
+  """
+  Send `result["data"]` with `jsonify`, or chunk by chunk when the client opted in to
+  streaming. With `Accept: application/x-ndjson` a list is sent as one line per item,
+  with `Accept: application/msgpack` the data is sent as MessagePack (see `flaskr.wire`).
+  """
+  if mw.wants_msgpack(request):
+    with metrics.timer("serialize"):
+      return Response(wire.encode(result["data"]), status=result["status_code"], mimetype=wire.MIMETYPE)
+  
+  if not mw.wants_stream(request):
+    with metrics.timer("serialize"):
+      return jsonify(result["data"]), result["status_code"]
+  
+  # compact in both modes (the stdlib provider adds spaces), with the provider's fallback for other types
+  default = current_app.json.default
+  dumps = lambda value: json_provider.dumps(value, default=default).decode()
+  data = result["data"]
+  if not mw.wants_ndjson(request):
+    return Response(iter_json(data, dumps), status=result["status_code"], mimetype="application/json")
+  
+  items = data if isinstance(data, list) else [data]
+  lines = chain.from_iterable(chain(iter_json(item, dumps), "\n") for item in items)
+  return Response(lines, status=result["status_code"], mimetype=mw.NDJSON_MIMETYPE)
+
 # ! transcribe
 @bp.route("/transcribe", methods=["POST"])
 def transcribe() -> Response:
-  data = mw.safely_get_json(request=request)
-  result = mw.process_transcribe_req(data)
+  data = mw.safely_get_body(request=request)
+  result = mw.process_transcribe_req(data, mw.wants_full_sequence(request))
   
-  return jsonify(result["data"]), result["status_code"]
+  return send_result(result)
 
 # ! translate
 @bp.route("/translate", methods=["POST"])
 def translate() -> Response:
-  data = mw.safely_get_json(request=request)
+  data = mw.safely_get_body(request=request)
   result = mw.process_translate_req(data)
   
-  return jsonify(result["data"]), result["status_code"]
+  return send_result(result)
+  
+# ! DNA to protein
+@bp.route("/dna-to-protein", methods=["POST"])
+def dna_to_protein() -> Response:
+  data = mw.safely_get_body(request=request)
+  result = mw.process_dna_to_protein_req(data)
   
+  return send_result(result)
+
 # ! RNA to DNA
 @bp.route("/rna-to-dna", methods=["POST"])
 def rna_to_dna() -> Response:
-  data = mw.safely_get_json(request=request)
-  result = mw.process_rna_to_dna_req(data)
+  data = mw.safely_get_body(request=request)
+  result = mw.process_rna_to_dna_req(data, mw.wants_full_sequence(request))
   
-  return jsonify(result["data"]), result["status_code"]
+  return send_result(result)
     
 # ! codon to protein
 @bp.route("/codon-to-protein", methods=["POST"])
 def codon_to_protein() -> Response:
-  data = mw.safely_get_json(request=request)
+  data = mw.safely_get_body(request=request)
   result = mw.process_codon_to_protein(data)
   
-  return jsonify(result["data"]), result["status_code"]
+  return send_result(result)
+
+# ! codons to proteins
+@bp.route("/codons-to-proteins", methods=["POST"])
+def codons_to_proteins() -> Response:
+  data = mw.safely_get_body(request=request)
+  result = mw.process_codons_to_proteins(data)
+  
+  return send_result(result)
+
+# ! find ORFs
+@bp.route("/orfs", methods=["POST"])
+def find_orfs() -> Response:
+  data = mw.safely_get_body(request=request)
+  result = mw.process_find_orfs_req(data)
+  
+  return send_result(result)
+
+# ! FASTA/FASTQ upload
+@bp.route("/fasta", methods=["POST"])
+def fasta() -> Response:
+  stream = mw.safely_get_sequence_stream(request=request)
+  results = mw.process_fasta_req(stream, request.args.to_dict())
+  lines = (current_app.json.dumps(result) + "\n" for result in results)
+  
+  return Response(stream_with_context(lines), mimetype=mw.NDJSON_MIMETYPE)
+
+# ! result cache
+@bp.route("/cache", methods=["GET"])
+def cache_stats() -> Response:
+  return send_result({ "data" : mw.result_cache.stats(), "status_code" : 200 })
+
+# ! batch
+@bp.route("/batch", methods=["POST"])
+def batch() -> Response:
+  data = mw.safely_get_body(request=request)
+  result = mw.process_batch_req(data)
+  
+  return send_result(result)
@@ -26,4 +26,33 @@ class SuccessResponse(BaseResponse):
   ```
   """
   data: object
-  
\ No newline at end of file
+
+class RecordSuccessResponse(SuccessResponse):
+  """
+  Result for one record of a streamed FASTA/FASTQ upload.
+  
+  ### Value:
+  ```
+  {
+    "id" : str,
+    "status_code" : int,
+    "data" : object
+  }
+  ```
+  """
+  id: str
+
+class RecordErrorResponse(ErrorResponse):
+  """
+  Error for one record of a streamed FASTA/FASTQ upload.
+  
+  ### Value:
+  ```
+  {
+    "id" : str,
+    "status_code" : int,
+    "error" : str
+  }
+  ```
+  """
+  id: str
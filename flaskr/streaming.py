@@ -0,0 +1,72 @@
+"""
+Incremental JSON encoding for large results.
+
+`iter_json` produces the same document as a regular JSON dump, but as a series of
+text chunks of about `CHUNK_SIZE` characters: dicts are walked item by item, runs
+of scalar list items are encoded `LIST_BATCH` at a time and long string values are
+written in slices, so the full response body is never built in memory.
+"""
+import functools
+import json
+from typing import Callable, Iterator
+
+CHUNK_SIZE = 64 * 1024 # characters per chunk, also the slice size of long strings
+LIST_BATCH = 4 * 1024 # scalar list items (such as protein names) encoded by one `dumps` call
+_SCALAR_TYPES = {str, int, float, bool, type(None)}
+
+_compact_dumps = functools.partial(json.dumps, separators=(",", ":"))
+
+def iter_json(
+  value: object,
+  dumps: Callable[[object], str] = _compact_dumps,
+  chunk_size: int = CHUNK_SIZE
+  ) -> Iterator[str]:
+  """
+  Encode `value` as JSON chunk by chunk, with object keys sorted like `jsonify`.
+  `dumps` encodes scalars, batches of scalar list items and string slices, and must
+  write compact JSON (no spaces after separators).
+  
+  ### Returns:
+  ```
+  Iterator[str]  # concatenated, the chunks form one JSON document
+  ```
+  """
+  buffer, size = [], 0
+  for part in _iter_parts(value, dumps, chunk_size):
+    buffer.append(part)
+    size += len(part)
+    if size >= chunk_size:
+      yield "".join(buffer)
+      buffer, size = [], 0
+  if buffer:
+    yield "".join(buffer)
+
+def _iter_parts(value: object, dumps: Callable[[object], str], chunk_size: int) -> Iterator[str]:
+  if isinstance(value, dict):
+    yield "{"
+    for i, (key, item) in enumerate(sorted(value.items(), key=lambda pair: str(pair[0]))):
+      yield ("," if i else "") + dumps(str(key)) + ":"
+      yield from _iter_parts(item, dumps, chunk_size)
+    yield "}"
+  elif isinstance(value, (list, tuple)):
+    yield "["
+    for start in range(0, len(value), LIST_BATCH):
+      batch = value[start:start + LIST_BATCH]
+      if start:
+        yield ","
+      # scalars only (no dicts to sort, no nesting): one call for the whole batch
+      if set(map(type, batch)) <= _SCALAR_TYPES:
+        yield dumps(list(batch))[1:-1]
+        continue
+      for i, item in enumerate(batch):
+        if i:
+          yield ","
+        yield from _iter_parts(item, dumps, chunk_size)
+    yield "]"
+  elif isinstance(value, str) and len(value) > chunk_size:
+    yield '"'
+    for i in range(0, len(value), chunk_size):
+      yield dumps(value[i:i+chunk_size])[1:-1]
+    yield '"'
+  else:
+    yield dumps(value)
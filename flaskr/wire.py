@@ -0,0 +1,102 @@
+"""
+MessagePack wire format with 2-bit packed sequences.
+
+Requests sent with `Content-Type: application/msgpack` carry the same envelope
+as the JSON payloads (see `dto.request_dto`). Any `sequence` may be a plain
+string or a packed sequence, a MessagePack extension type:
+- code `1` is DNA, code `2` is RNA;
+- data is the base count (uint32, big endian) followed by the bases, four per
+  byte with the first base in the two highest bits (`T`/`U`=0, `C`=1, `A`=2,
+  `G`=3), as in `dna.packed.PackedSequence`.
+
+Packed sequences are unpacked while the body is decoded, so the DTOs and
+`dna_tools` see ordinary strings. Responses are sent as MessagePack when the
+client sends `Accept: application/msgpack`; the `sequence` of every DNA/RNA
+result is then packed the same way, and `full_sequence` (the same bases with the
+edge labels, `f"{read_from}'-{sequence}-{to}'"`) is left out. Errors are always JSON.
+
+msgpack is not a hard dependency; without it MessagePack requests get 415.
+"""
+import struct
+from dna.packed import ALPHABETS, PackedSequence
+
+try:
+  import msgpack
+except ImportError:
+  msgpack = None
+
+HAS_MSGPACK = msgpack is not None
+MIMETYPE = "application/msgpack"
+_MIMETYPES = {MIMETYPE, "application/x-msgpack"}
+EXT_DNA = 1
+EXT_RNA = 2
+_EXT_KINDS = { EXT_DNA : "DNA", EXT_RNA : "RNA" }
+_KIND_EXTS = { kind: code for code, kind in _EXT_KINDS.items() }
+_LENGTH = struct.Struct(">I")
+
+def is_msgpack(mimetype: str | None) -> bool:
+  """Whether `mimetype` (without parameters) is MessagePack."""
+  return mimetype in _MIMETYPES
+
+def pack_sequence(sequence: PackedSequence) -> "msgpack.ExtType":
+  """Wire form of a packed sequence."""
+  return msgpack.ExtType(_KIND_EXTS[sequence.kind], _LENGTH.pack(len(sequence)) + sequence.to_bytes())
+
+def unpack_sequence(code: int, data: bytes) -> PackedSequence:
+  """
+  Packed sequence from its wire form.
+  
+  ### Raises:
+    - **ValueError:**
+      If the extension code is unknown or the base count does not match the data
+  """
+  kind = _EXT_KINDS.get(code)
+  if kind is None or len(data) < _LENGTH.size:
+    raise ValueError(f"Invalid packed sequence (extension type {code})", 400)
+  (length,) = _LENGTH.unpack_from(data)
+  if (length + 3) // 4 != len(data) - _LENGTH.size:
+    raise ValueError(f"Invalid packed sequence: {length} bases in {len(data) - _LENGTH.size} bytes", 400)
+  return PackedSequence(data[_LENGTH.size:], length, kind)
+
+def _ext_hook(code: int, data: bytes) -> str:
+  return unpack_sequence(code, data).to_str()
+
+def decode(body: bytes) -> dict:
+  """
+  Decode a MessagePack request body, unpacking packed sequences into strings.
+  
+  ### Raises:
+    - **ValueError:**
+      If the body is not a MessagePack map or holds an invalid packed sequence
+  """
+  try:
+    data = msgpack.unpackb(body, ext_hook=_ext_hook, raw=False)
+  except Exception as e:
+    # errors from unpack_sequence already carry their message and status code
+    if isinstance(e, ValueError) and len(e.args) == 2:
+      raise
+    raise ValueError("Invalid MessagePack format", 400) from None
+  if not isinstance(data, dict):
+    raise ValueError("Invalid MessagePack format", 400)
+  return data
+
+def _pack_sequences(value: object) -> object:
+  """
+  Copy of a result with the `sequence` of every DNA/RNA result replaced by its packed
+  form and its `full_sequence` removed, as it can be rebuilt from the edges and `sequence`.
+  """
+  if isinstance(value, dict):
+    kind, sequence = value.get("nucleic_acid_type"), value.get("sequence")
+    if kind in ALPHABETS and isinstance(sequence, str):
+      packed = { key: _pack_sequences(item) for key, item in value.items() if key not in ("sequence", "full_sequence") }
+      packed["sequence"] = pack_sequence(PackedSequence.from_str(sequence, kind))
+      return packed
+    return { key: _pack_sequences(item) for key, item in value.items() }
+  if isinstance(value, list) and value and isinstance(value[0], (dict, list)):
+    # batch results; lists of names or codons are left as they are
+    return [_pack_sequences(item) for item in value]
+  return value
+
+def encode(data: object) -> bytes:
+  """Encode a response body as MessagePack with packed sequences."""
+  return msgpack.packb(_pack_sequences(data), use_bin_type=True)
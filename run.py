@@ -1,5 +1,22 @@
+import os
 import waitress
-from flaskr import create_app
+from flaskr import admission, create_app
 
-app = create_app()
-waitress.serve(app, host="0.0.0.0", port=5000)
+MAX_BODY_BYTES = 128 * 1024 * 1024
+
+if __name__ == "__main__":
+  app = create_app(
+    pool_size=os.cpu_count() or 1,
+    max_body_bytes=MAX_BODY_BYTES,
+    work_budget=4 * MAX_BODY_BYTES # bases in flight before new requests get 503
+  )
+  waitress.serve(
+    app,
+    host="0.0.0.0",
+    port=5000,
+    threads=8,
+    connection_limit=256,
+    # /api/fasta accepts uploads above MAX_BODY_BYTES, the app enforces every per-path cap
+    max_request_body_size=admission.largest_body_limit(MAX_BODY_BYTES),
+    channel_timeout=60
+  )
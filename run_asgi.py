@@ -0,0 +1,10 @@
+import os
+import uvicorn
+from flaskr.asgi import create_asgi_app
+
+if __name__ == "__main__":
+  app = create_asgi_app(
+    pool_size=os.cpu_count() or 1,
+    work_budget=4 * 128 * 1024 * 1024 # bases in flight before new requests get 503
+  )
+  uvicorn.run(app, host="0.0.0.0", port=5000, backlog=4096, limit_concurrency=1024)
@@ -0,0 +1,38 @@
+import time
+STARTED = time.perf_counter()
+
+import argparse
+import functools
+import logging
+from flaskr import admission, create_app, launcher
+
+MAX_BODY_BYTES = 128 * 1024 * 1024
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description="Serve the API with one waitress process per core")
+  parser.add_argument("--host", default="0.0.0.0")
+  parser.add_argument("--port", type=int, default=5000)
+  parser.add_argument("--workers", type=int, help="worker processes (default: one per CPU core)")
+  args = parser.parse_args()
+  logging.basicConfig(level=logging.INFO, format="%(asctime)s %(process)d %(name)s %(message)s")
+  
+  # every worker is a full server, so requests run inline instead of on a per-worker pool;
+  # the work budget applies per worker
+  app_factory = functools.partial(
+    create_app,
+    pool_size=0,
+    max_body_bytes=MAX_BODY_BYTES,
+    work_budget=MAX_BODY_BYTES
+  )
+  launcher.serve(
+    app_factory,
+    host=args.host,
+    port=args.port,
+    workers=args.workers,
+    started=STARTED,
+    threads=4,
+    connection_limit=256,
+    # /api/fasta accepts uploads above MAX_BODY_BYTES, the app enforces every per-path cap
+    max_request_body_size=admission.largest_body_limit(MAX_BODY_BYTES),
+    channel_timeout=60
+  )